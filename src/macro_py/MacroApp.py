@@ -94,8 +94,7 @@ class MacroApp:
         """Save current macro to a timestamped JSON file (CLI mode)."""
         if self.macro_data:
             filename = f"macro_{int(time.time())}.json"
-            self.recorder.events = self.macro_data
-            self.recorder.save_macro(filename)
+            self.recorder.save_macro(filename, self.macro_data)
             print(f"💾 Saved to {filename}")
 
     def load_macro_file(self):
@@ -104,7 +103,9 @@ class MacroApp:
         filename = input("Enter macro filename: ")
         try:
             self.recorder.load_macro(filename)
-            self.macro_data = self.recorder.events.copy()
+            # Share the loaded list: the next start_recording() rebinds
+            # recorder.events to a fresh list, so macro_data is never mutated
+            self.macro_data = self.recorder.events
             print(f"📂 Loaded {len(self.macro_data)} events")
         except Exception as e:
             print(f"Error loading file: {e}")
@@ -9,7 +9,7 @@ import subprocess
 import logging
 import multiprocessing as mp
 import threading
-import json
+from collections import deque
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -28,22 +28,106 @@ from PyQt6.QtWidgets import (
     QToolBar,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, QAbstractListModel, QModelIndex
-from PyQt6.QtGui import QKeySequence, QAction, QColor, QPalette
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QSize,
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QMetaObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QAction, QColor, QPalette
 from PyQt6.QtWidgets import QStyledItemDelegate
 from .MacroApp import MacroApp
 from pynput import keyboard
 
+# AppKit comes with pynput's PyObjC dependencies on macOS; elsewhere (or if it
+# is missing) app switching falls back to osascript
+try:
+    from AppKit import NSWorkspace, NSApplicationActivateIgnoringOtherApps
+except ImportError:
+    NSWorkspace = None
+
+# Upper bound on rows kept in the log view; oldest rows are dropped past this
+LOG_MAX_ROWS = 2000
+
+# Upper bound on recorder events waiting to be shown in the log
+PENDING_EVENTS_MAX = 10000
+
+# Delay after the first event of a burst before the log is flushed, so a
+# burst of mouse moves lands in the view as one batch
+LOG_FLUSH_DELAY_MS = 50
+
+# Most recorder events inserted into the log per event loop pass
+LOG_FLUSH_CHUNK = 500
+
+# Leading emoji of log lines; shared by the formatters and EventLogDelegate
+_MOUSE_MARK = "🖱️"
+_KEY_MARK = "⌨️"
+_SYSTEM_MARKS = ("📝", "✅", "⏳", "💡")
+_ERROR_MARKS = ("❌", "❓")
+_MOUSE_PREFIX = _MOUSE_MARK + "  ["
+_KEY_PREFIX = _KEY_MARK + "  ["
+_UNKNOWN_PREFIX = "❓ ["
+
+# Field defaults used when formatting an event that lacks recorder fields
+_EVENT_DEFAULTS = {
+    "type": "unknown",
+    "time": 0,
+    "x": 0,
+    "y": 0,
+    "dx": 0,
+    "dy": 0,
+    "button": "unknown",
+    "pressed": False,
+    "key": "unknown",
+}
+
+# Global hotkeys: pynput key name -> MacroGUI slot invoked on the GUI thread
+GLOBAL_HOTKEYS = {
+    "f1": "start_recording_gui",
+    "f2": "stop_recording_gui",
+    "f3": "play_once_gui",
+    "f5": "stop_playback_gui",
+}
+
+_LOG_STYLESHEET = """
+    QListView {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Monaco', 'Consolas', monospace;
+        font-size: 11px;
+        border: 1px solid #444;
+    }
+    QListView::item:alternate {
+        background-color: #252525;
+    }
+"""
+
+# Shown in the log when recording fails to start
+_TROUBLESHOOTING = (
+    "💡 Troubleshooting Tips:",
+    "• Go to System Preferences → Security & Privacy → Privacy",
+    "• Click 'Accessibility' and add your Terminal or Python",
+    "• Restart the application after granting permissions",
+)
+
 
-def _f5_hotkey_subprocess(stop_signal_queue, stop_event):
+def _hotkey_subprocess(hotkey_queue, stop_event):
     """
-    Subprocess function to listen for F5 key press on macOS.
+    Subprocess function to listen for the global hotkeys on macOS.
 
     This runs in a separate process to avoid CGEventTap conflicts with PyQt6.
-    When F5 is pressed, sends a signal to the main process via the queue.
+    When one of GLOBAL_HOTKEYS is pressed, sends its key name (e.g. "f1") to
+    the main process via the queue.
 
     Args:
-        stop_signal_queue: multiprocessing.Queue to send stop signals
+        hotkey_queue: multiprocessing.Queue to send hotkey names
         stop_event: multiprocessing.Event to signal subprocess termination
     """
     import queue
@@ -54,34 +138,31 @@ def _f5_hotkey_subprocess(stop_signal_queue, stop_event):
 
     def on_key_press(key):
         try:
-            if key == kb.Key.f5:
-                # Send stop signal to main process with timeout
+            name = getattr(key, "name", None)
+            if name in GLOBAL_HOTKEYS:
+                # Send hotkey to main process with timeout
                 try:
-                    stop_signal_queue.put("STOP", timeout=0.1)
+                    hotkey_queue.put(name, timeout=0.1)
                 except queue.Full:
-                    logger.warning("F5 hotkey subprocess: Queue full, STOP signal dropped")
+                    logger.warning("Hotkey subprocess: Queue full, %s dropped", name)
                 except (OSError, ValueError):
                     # Queue closed or invalid state
-                    logger.exception("F5 hotkey subprocess: Queue error when sending STOP")
-        except AttributeError:
-            # Key doesn't have the expected attributes
-            pass
+                    logger.exception("Hotkey subprocess: Queue error when sending %s", name)
         except Exception:
-            logger.exception("F5 hotkey subprocess: Unexpected error in on_key_press")
+            logger.exception("Hotkey subprocess: Unexpected error in on_key_press")
 
     listener = None
     try:
         listener = kb.Listener(on_press=on_key_press)
         listener.start()
-        logger.debug("F5 hotkey subprocess: Listener started")
+        logger.debug("Hotkey subprocess: Listener started")
 
-        # Wait for stop event
-        while not stop_event.is_set():
-            stop_event.wait(timeout=0.1)
+        # Block until asked to stop (no periodic wakeups)
+        stop_event.wait()
 
-        logger.debug("F5 hotkey subprocess: Stop event received, shutting down")
+        logger.debug("Hotkey subprocess: Stop event received, shutting down")
     except Exception:
-        logger.exception("F5 hotkey subprocess: Error in main loop")
+        logger.exception("Hotkey subprocess: Error in main loop")
     finally:
         # Always stop the listener on exit
         if listener is not None:
@@ -90,9 +171,9 @@ def _f5_hotkey_subprocess(stop_signal_queue, stop_event):
                 # Wait for listener thread to finish
                 if hasattr(listener, 'join'):
                     listener.join(timeout=1.0)
-                logger.debug("F5 hotkey subprocess: Listener stopped")
+                logger.debug("Hotkey subprocess: Listener stopped")
             except Exception:
-                logger.exception("F5 hotkey subprocess: Error stopping listener")
+                logger.exception("Hotkey subprocess: Error stopping listener")
 
 
 class EventLogModel(QAbstractListModel):
@@ -103,26 +184,25 @@ class EventLogModel(QAbstractListModel):
     to a QTextEdit widget.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_rows=LOG_MAX_ROWS):
         super().__init__(parent)
-        self._events = []
-        self._formatted_cache = []
-        self.last_mouse_pos = None
+        # Display strings are formatted once at insert time; the source event
+        # dicts are not kept, as data() only ever needs the string
+        self._lines = []
+        self.max_rows = max_rows
         self.mouse_move_count = 0
 
     def rowCount(self, parent=QModelIndex()):
         """Return the number of events in the model."""
-        return len(self._events)
+        return len(self._lines)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         """Return formatted event data for the given index."""
-        if not index.isValid() or index.row() >= len(self._events):
+        if role != Qt.ItemDataRole.DisplayRole:
             return None
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            # Return cached formatted string
-            return self._formatted_cache[index.row()]
-
+        row = index.row()
+        if 0 <= row < len(self._lines):
+            return self._lines[row]
         return None
 
     def add_event(self, event):
@@ -132,44 +212,92 @@ class EventLogModel(QAbstractListModel):
             event: Event dictionary from the recorder
 
         Returns:
-            bool: True if event was added, False if filtered out
+            bool: True if event was added, False if it produced no log line
         """
         formatted = self._format_event(event)
         if formatted is None:
-            # Event was filtered (e.g., insignificant mouse move)
+            # Event produced no log line
             return False
 
         # Notify views that we're adding a row
-        row = len(self._events)
+        row = len(self._lines)
         self.beginInsertRows(QModelIndex(), row, row)
-        self._events.append(event)
-        self._formatted_cache.append(formatted)
+        self._lines.append(formatted)
         self.endInsertRows()
+        self._trim()
         return True
 
+    def add_events(self, events):
+        """Add several events to the model with a single row insertion.
+
+        Args:
+            events: List of event dictionaries from the recorder
+
+        Returns:
+            int: Number of rows added
+        """
+        # Rows beyond max_rows would be trimmed straight away; don't format them
+        skip = len(events) - self.max_rows
+        if skip > 0:
+            self.skip_events(events[:skip])
+            events = events[skip:]
+
+        # Hoist the formatter lookup out of the per-event comprehension
+        fmt = self._format_event
+        new_lines = [line for line in map(fmt, events) if line is not None]
+        if not new_lines:
+            return 0
+
+        row = len(self._lines)
+        self.beginInsertRows(QModelIndex(), row, row + len(new_lines) - 1)
+        if row:
+            self._lines.extend(new_lines)
+        else:
+            # Adopt the freshly built list instead of copying it
+            self._lines = new_lines
+        self.endInsertRows()
+        self._trim()
+        return len(new_lines)
+
+    def skip_events(self, events):
+        """Account for events that will never be shown as rows.
+
+        Keeps mouse move numbering continuous without formatting them.
+        """
+        self.mouse_move_count += sum(
+            1 for event in events if event.get("type") == "mouse_move"
+        )
+
     def append_system_message(self, message: str) -> None:
         """Append a pre-formatted system message to the model."""
-        row = len(self._events)
-        self.beginInsertRows(QModelIndex(), row, row)
-        self._events.append(
-            {
-                "type": "__system_message__",
-                "message": message,
-                "time": 0.0,
-            }
-        )
-        self._formatted_cache.append(message)
+        self.append_system_messages([message])
+
+    def append_system_messages(self, messages) -> None:
+        """Append several pre-formatted system messages in a single insert."""
+        if not messages:
+            return
+        row = len(self._lines)
+        self.beginInsertRows(QModelIndex(), row, row + len(messages) - 1)
+        self._lines.extend(messages)
         self.endInsertRows()
+        self._trim()
+
+    def _trim(self):
+        """Drop the oldest rows once the model grows past max_rows."""
+        excess = len(self._lines) - self.max_rows
+        if excess <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+        del self._lines[:excess]
+        self.endRemoveRows()
 
     def clear_events(self):
         """Clear all events from the model."""
-        if not self._events:
+        if not self._lines:
             return
 
         self.beginResetModel()
-        self._events.clear()
-        self._formatted_cache.clear()
-        self.last_mouse_pos = None
+        self._lines.clear()
         self.mouse_move_count = 0
         self.endResetModel()
 
@@ -180,46 +308,116 @@ class EventLogModel(QAbstractListModel):
             event: Event dictionary from the recorder
 
         Returns:
-            str: Formatted event string, or None to filter out this event
+            str: Formatted event string, or None if the event is not logged
         """
-        event_type = event.get("type", "unknown")
-        timestamp = f"{event.get('time', 0):.3f}s"
-
-        if event_type == "mouse_move":
-            x, y = event.get("x", 0), event.get("y", 0)
-            # Reduce spam by only showing significant mouse movements
-            if self.last_mouse_pos is None or (
-                abs(x - self.last_mouse_pos[0]) > 10
-                or abs(y - self.last_mouse_pos[1]) > 10
-            ):
-                self.last_mouse_pos = (x, y)
-                self.mouse_move_count += 1
-                return (
-                    f"🖱️  [{timestamp}] Mouse Move #{self.mouse_move_count} → ({x}, {y})"
-                )
-            return None  # Skip this event
+        # Recorder events always carry every field for their type, so index
+        # directly and only fill defaults for malformed events
+        try:
+            event_type = event["type"]
+            timestamp = "%.3fs" % event["time"]
+            formatter = self._FORMATTERS.get(event_type)
+            if formatter is None:
+                return f"{_UNKNOWN_PREFIX}{timestamp}] Unknown Event → {event_type}"
+            return formatter(self, event, timestamp)
+        except KeyError:
+            return self._format_event({**_EVENT_DEFAULTS, **event})
+
+    def _fmt_mouse_move(self, event, timestamp):
+        # Insignificant moves are already dropped by the recorder
+        x, y = event["x"], event["y"]
+        self.mouse_move_count += 1
+        return f"{_MOUSE_PREFIX}{timestamp}] Mouse Move #{self.mouse_move_count} → ({x}, {y})"
+
+    def _fmt_mouse_click(self, event, timestamp):
+        action = "Press" if event["pressed"] else "Release"
+        button, x, y = event["button"], event["x"], event["y"]
+        return f"{_MOUSE_PREFIX}{timestamp}] Mouse {action} → {button} at ({x}, {y})"
+
+    def _fmt_mouse_scroll(self, event, timestamp):
+        dx, dy = event["dx"], event["dy"]
+        x, y = event["x"], event["y"]
+        return f"{_MOUSE_PREFIX}{timestamp}] Mouse Scroll → ({dx}, {dy}) at ({x}, {y})"
+
+    def _fmt_key_press(self, event, timestamp):
+        return f"{_KEY_PREFIX}{timestamp}] Key Press → {event['key']}"
+
+    def _fmt_key_release(self, event, timestamp):
+        return f"{_KEY_PREFIX}{timestamp}] Key Release → {event['key']}"
+
+    # Event type -> formatter, looked up once per event instead of an if/elif chain
+    _FORMATTERS = {
+        "mouse_move": _fmt_mouse_move,
+        "mouse_click": _fmt_mouse_click,
+        "mouse_scroll": _fmt_mouse_scroll,
+        "key_press": _fmt_key_press,
+        "key_release": _fmt_key_release,
+    }
+
+
+class RecorderSignals(QObject):
+    """Qt signal bridge for events pushed from recorder threads.
+
+    Emitting from a listener thread is delivered to slots on the GUI thread
+    through a queued connection.
+    """
 
-        elif event_type == "mouse_click":
-            button = event.get("button", "unknown")
-            action = "Press" if event.get("pressed") else "Release"
-            x, y = event.get("x", 0), event.get("y", 0)
-            return f"🖱️  [{timestamp}] Mouse {action} → {button} at ({x}, {y})"
+    events_available = pyqtSignal()
 
-        elif event_type == "mouse_scroll":
-            dx, dy = event.get("dx", 0), event.get("dy", 0)
-            x, y = event.get("x", 0), event.get("y", 0)
-            return f"🖱️  [{timestamp}] Mouse Scroll → ({dx}, {dy}) at ({x}, {y})"
 
-        elif event_type == "key_press":
-            key = event.get("key", "unknown")
-            return f"⌨️  [{timestamp}] Key Press → {key}"
+class PlayerSignals(QObject):
+    """Qt signal bridge for progress reported by the playback thread."""
 
-        elif event_type == "key_release":
-            key = event.get("key", "unknown")
-            return f"⌨️  [{timestamp}] Key Release → {key}"
+    loop_advanced = pyqtSignal(int, int)
+    playback_finished = pyqtSignal()
 
-        else:
-            return f"❓ [{timestamp}] Unknown Event → {event_type}"
+
+class MacroFileSignals(QObject):
+    """Qt signal bridge for macro save/load tasks run on the thread pool."""
+
+    saved = pyqtSignal(str)
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class SaveMacroTask(QRunnable):
+    """Write a snapshot of macro events to disk off the GUI thread."""
+
+    def __init__(self, recorder, filename, events, signals):
+        super().__init__()
+        self.recorder = recorder
+        self.filename = filename
+        self.events = events
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.recorder.save_macro(self.filename, self.events)
+        except Exception as e:
+            self.signals.failed.emit(f"❌ Failed to save {self.filename}: {e}")
+            return
+        self.signals.saved.emit(self.filename)
+
+
+class LoadMacroTask(QRunnable):
+    """Parse a macro file off the GUI thread.
+
+    Recorder state is left alone; the parsed list goes back to the GUI thread
+    through the loaded signal, so a load cannot swap out a live recording.
+    """
+
+    def __init__(self, recorder, filename, signals):
+        super().__init__()
+        self.recorder = recorder
+        self.filename = filename
+        self.signals = signals
+
+    def run(self):
+        try:
+            events = self.recorder.read_macro(self.filename)
+        except Exception as e:
+            self.signals.failed.emit(f"❌ Failed to load {self.filename}: {e}")
+            return
+        self.signals.loaded.emit(events)
 
 
 class EventLogDelegate(QStyledItemDelegate):
@@ -241,18 +439,13 @@ class EventLogDelegate(QStyledItemDelegate):
         text = index.data(Qt.ItemDataRole.DisplayRole)
         if text:
             # Color code based on emoji/event type
-            if text.startswith("🖱️"):
+            if text.startswith(_MOUSE_MARK):
                 option.palette.setColor(QPalette.ColorGroup.All, QPalette.ColorRole.Text, self.mouse_color)
-            elif text.startswith("⌨️"):
+            elif text.startswith(_KEY_MARK):
                 option.palette.setColor(QPalette.ColorGroup.All, QPalette.ColorRole.Text, self.keyboard_color)
-            elif (
-                text.startswith("📝")
-                or text.startswith("✅")
-                or text.startswith("⏳")
-                or text.startswith("💡")
-            ):
+            elif text.startswith(_SYSTEM_MARKS):
                 option.palette.setColor(QPalette.ColorGroup.All, QPalette.ColorRole.Text, self.system_color)
-            elif text.startswith("❌") or text.startswith("❓"):
+            elif text.startswith(_ERROR_MARKS):
                 option.palette.setColor(QPalette.ColorGroup.All, QPalette.ColorRole.Text, self.unknown_color)
 
 
@@ -297,24 +490,13 @@ class MacroGUI(QMainWindow):
         self.log_console.setItemDelegate(self.log_delegate)
 
         self.log_console.setMaximumHeight(200)
-        self.log_console.setStyleSheet(
-            """
-            QListView {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Monaco', 'Consolas', monospace;
-                font-size: 11px;
-                border: 1px solid #444;
-            }
-            QListView::item:alternate {
-                background-color: #252525;
-            }
-        """
-        )
+        self.log_console.setStyleSheet(_LOG_STYLESHEET)
         # Enable alternating row colors for better readability
         self.log_console.setAlternatingRowColors(True)
         # Disable editing
         self.log_console.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # All rows are single-line text: let the view skip per-row size hints
+        self.log_console.setUniformItemSizes(True)
         self.log_section = QGroupBox("Log")
         self.log_section.setStyleSheet(
             """
@@ -350,33 +532,65 @@ class MacroGUI(QMainWindow):
         self.setStatusBar(self.status_bar)
         # Visual separator for footer
         self.status_bar.setStyleSheet("QStatusBar { border-top: 1px solid #c8c8c8; }")
-        self.status_bar.showMessage("Ready - Click Start Recording to begin")
-
-        # Timer for updating log
-        self.log_timer = QTimer()
-        self.log_timer.timeout.connect(self.update_log)
-        self.last_event_count = 0
-        # self.last_mouse_pos = None
-        # self.mouse_move_count = 0
+        # Permanent label instead of showMessage(): setText() only schedules a
+        # repaint, and the text is never cleared by transient tips
+        self.status_label = QLabel("Ready - Click Start Recording to begin")
+        self.status_bar.addPermanentWidget(self.status_label, 1)
+
+        # Recorder threads push events into a bounded buffer and wake the GUI
+        # thread once per burst instead of being polled
+        self._pending_events = deque(maxlen=PENDING_EVENTS_MAX)
+        self._drain_scheduled = False
+        self._scroll_pending = False
+        # Mirrors log_section visibility for recorder threads (read-only there)
+        self._log_visible = False
+        self.recorder_signals = RecorderSignals(self)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_DELAY_MS)
+        self._log_flush_timer.timeout.connect(self.on_new_events)
+        self.recorder_signals.events_available.connect(self._log_flush_timer.start)
+        self.app.recorder.event_callback = self._queue_recorder_events
+        # Player reports loop changes and completion instead of being polled
+        self.player_signals = PlayerSignals(self)
+        self.player_signals.loop_advanced.connect(self._on_loop_advanced)
+        self.player_signals.playback_finished.connect(self._on_playback_finished)
+        self.app.player.loop_callback = self.player_signals.loop_advanced.emit
+        self.app.player.finished_callback = self.player_signals.playback_finished.emit
+        self._playback_active = False
+        self._beeped_for_this_run = False
+        # Save/load run on the thread pool and report back through these signals
+        self.file_signals = MacroFileSignals(self)
+        self.file_signals.saved.connect(self._on_macro_saved)
+        self.file_signals.loaded.connect(self._on_macro_loaded)
+        self.file_signals.failed.connect(self._on_macro_file_failed)
+        # Only one background save/load at a time; they share recorder state
+        self._file_task_active = False
         self.was_hidden_for_recording = False
         self._restore_on_top_after_record = False
         self._restore_on_top_after_play = False
-        self._play_hotkey_listener = None
+        # Debounced always-on-top state, applied by _apply_on_top
+        self._pending_on_top = True
+        self._on_top_apply_scheduled = False
+        self._hotkey_listener = None
         self.prev_front_app_name = None
+        self._prev_front_app = None
+        # Save/load dialog, created on first use and reused afterwards
+        self._file_dialog = None
 
-        # Subprocess components for F5 hotkey on macOS
-        self._f5_subprocess = None
-        self._f5_stop_event = None
-        self._f5_signal_queue = None
-        self._f5_consumer_thread = None
-        self._f5_consumer_stop_event = None
-
-        # Timer for updating playback progress in the status bar
-        self.play_progress_timer = QTimer()
-        self.play_progress_timer.timeout.connect(self.update_play_progress)
+        # Subprocess components for global hotkeys on macOS
+        self._hotkey_subprocess = None
+        self._hotkey_stop_event = None
+        self._hotkey_queue = None
+        self._hotkey_consumer_thread = None
+        self._hotkey_consumer_stop_event = None
 
     def _build_toolbar(self):
-        """Create the main toolbar and wire up actions and shortcuts."""
+        """Create the main toolbar and wire up actions.
+
+        F-key shortcuts are handled by the global hotkey hook so they also work
+        while the window is in the background.
+        """
         toolbar = QToolBar("Main")
         toolbar.setMovable(False)
         toolbar.setIconSize(QSize(18, 18))
@@ -386,26 +600,18 @@ class MacroGUI(QMainWindow):
 
         # Actions
         self.action_start_rec = QAction("Start", self)
-        self.action_start_rec.setShortcut(QKeySequence("F1"))
-        self.action_start_rec.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         self.action_start_rec.triggered.connect(self.start_recording_gui)
 
         self.action_stop_rec = QAction("Stop Rec", self)
-        self.action_stop_rec.setShortcut(QKeySequence("F2"))
-        self.action_stop_rec.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         self.action_stop_rec.triggered.connect(self.stop_recording_gui)
 
         self.action_play_once = QAction("Play 1x", self)
-        self.action_play_once.setShortcut(QKeySequence("F3"))
-        self.action_play_once.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         self.action_play_once.triggered.connect(self.play_once_gui)
 
         self.action_play_infinite = QAction("Play ∞", self)
         self.action_play_infinite.triggered.connect(self.play_infinite_gui)
 
         self.action_stop_play = QAction("Stop", self)
-        self.action_stop_play.setShortcut(QKeySequence("F5"))
-        self.action_stop_play.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         self.action_stop_play.triggered.connect(self.stop_playback_gui)
 
         toolbar.addAction(self.action_start_rec)
@@ -482,6 +688,10 @@ class MacroGUI(QMainWindow):
         self.activate_on_play_checkbox.setChecked(True)
         options_layout.addWidget(self.activate_on_play_checkbox)
 
+        self.beep_on_complete_checkbox = QCheckBox("Beep on complete")
+        self.beep_on_complete_checkbox.setChecked(True)
+        options_layout.addWidget(self.beep_on_complete_checkbox)
+
         clear_log_btn = QPushButton("Clear Log")
         clear_log_btn.clicked.connect(self.clear_log)
         options_layout.addWidget(clear_log_btn)
@@ -517,19 +727,24 @@ class MacroGUI(QMainWindow):
         shortcuts_layout.addWidget(shortcuts_label)
         layout.addWidget(self.shortcuts_group)
 
+    @pyqtSlot()
     def start_recording_gui(self):
         """Start recording and update UI/log state accordingly."""
+        if self._file_task_active:
+            self.status_label.setText(
+                "Cannot start recording - a macro file operation is still running"
+            )
+            return
         if not self.app.recorder.recording and not self.app.player.playing:
             try:
-                self.status_bar.showMessage("🔄 Starting recording...")
+                self.status_label.setText("🔄 Starting recording...")
 
                 # Instead of hiding, drop always-on-top and send window to background
                 if self.isVisible():
                     # Remember if we need to restore always-on-top after recording
                     if self.always_on_top_action.isChecked():
                         self._restore_on_top_after_record = True
-                        # Uncheck triggers flag update
-                        self.always_on_top_action.setChecked(False)
+                        self._set_on_top_now(False)
                     # Send behind other windows but keep taskbar entry and shortcuts active
                     self.lower()
 
@@ -538,51 +753,38 @@ class MacroGUI(QMainWindow):
                     self.activate_previous_app()
 
                 # Show log console first
-                self.log_section.show()
+                self._set_log_visible(True)
                 self._log_clear()
-                self._log_append("📝 Initializing Recording Session...")
-                self._log_append("=" * 50)
 
-                # Update button text immediately
-                self.toggle_log_action.blockSignals(True)
-                self.toggle_log_action.setChecked(True)
-                self.toggle_log_action.setText("Hide Log")
-                self.toggle_log_action.blockSignals(False)
-
-                # Initialize counters first
-                self.last_event_count = 0
-                # self.last_mouse_pos = None
-                # self.mouse_move_count = 0
-
-                # Defer recording startup to avoid PyQt6 event loop conflicts
-                QTimer.singleShot(100, self._start_recording_delayed)
+                # Defer recording startup to the next event loop pass to avoid
+                # PyQt6 event loop conflicts, without adding a fixed delay
+                QMetaObject.invokeMethod(
+                    self,
+                    "_start_recording_delayed",
+                    Qt.ConnectionType.QueuedConnection,
+                )
 
-                self.status_bar.showMessage("🔄 Initializing listeners...")
-                self._log_append("⏳ Starting listeners in background...")
+                self.status_label.setText("🔄 Initializing listeners...")
+                self._log_append_many(
+                    [
+                        "📝 Initializing Recording Session...",
+                        "=" * 50,
+                        "⏳ Starting listeners in background...",
+                    ]
+                )
 
             except Exception as e:
                 # Recording failed - show error and clean up
                 error_msg = f"❌ Failed to start recording: {str(e)}"
                 print(error_msg)
-                self.status_bar.showMessage("❌ Recording failed - Check permissions")
+                self.status_label.setText("❌ Recording failed - Check permissions")
 
                 # If we hid the window, restore it on failure
                 if self.was_hidden_for_recording:
                     self.was_hidden_for_recording = False
                     self.show()
 
-                self._log_append(f"❌ Recording Failed: {str(e)}")
-                self._log_append("")
-                self._log_append("💡 Troubleshooting Tips:")
-                self._log_append(
-                    "• Go to System Preferences → Security & Privacy → Privacy"
-                )
-                self._log_append(
-                    "• Click 'Accessibility' and add your Terminal or Python"
-                )
-                self._log_append(
-                    "• Restart the application after granting permissions"
-                )
+                self._append_troubleshooting(e)
 
                 # Reset button state
                 self.toggle_log_action.blockSignals(True)
@@ -591,85 +793,95 @@ class MacroGUI(QMainWindow):
                 self.toggle_log_action.blockSignals(False)
 
         else:
-            self.status_bar.showMessage(
+            self.status_label.setText(
                 "Cannot start recording - already recording or playing"
             )
 
+    @pyqtSlot()
     def stop_recording_gui(self):
         """Stop recording and restore window/topmost state if needed."""
         if self.app.recorder.recording:
             self.app.stop_recording()
-            self.status_bar.showMessage(
+            self.status_label.setText(
                 f"⏹️ Recording stopped - {len(self.app.macro_data)} events recorded"
             )
 
-            # Stop log timer and add summary
-            if self.log_timer.isActive():
-                self.log_timer.stop()
-            self._log_append("=" * 50)
-            self._log_append(
-                f"✅ Recording Complete: {len(self.app.macro_data)} events captured"
-            )
+            # Add summary
+            summary = [
+                "=" * 50,
+                f"✅ Recording Complete: {len(self.app.macro_data)} events captured",
+            ]
+            dropped = self.app.recorder.dropped_events
+            if dropped:
+                summary.append(f"❌ {dropped} events dropped - event queue was full")
+            self._log_append_many(summary)
 
             # Restore GUI if we changed z-order/flags for recording
             if self._restore_on_top_after_record:
                 self._restore_on_top_after_record = False
                 # Restore always-on-top if it was previously enabled
                 if not self.always_on_top_action.isChecked():
-                    self.always_on_top_action.setChecked(True)
+                    self._set_on_top_now(True)
                 # Bring window to front
                 self.show()
                 self.raise_()
                 self.activateWindow()
 
         else:
-            self.status_bar.showMessage("Not currently recording")
+            self.status_label.setText("Not currently recording")
 
+    @pyqtSlot()
     def play_once_gui(self):
         """Prepare and play current macro once."""
+        # F3 is a global hotkey and still fires while recording; playing then
+        # would feed synthetic input into the recording
+        if self.app.recorder.recording:
+            self.status_label.setText("Cannot play while recording")
+            return
         if self.app.macro_data and not self.app.player.playing:
             # Prepare UI and hotkeys
             self._prepare_for_playback()
 
             self.app.play_once()
-            self.status_bar.showMessage("▶️ Running 1/1 loops")
-            if not self.play_progress_timer.isActive():
-                self.play_progress_timer.start(200)
+            self.status_label.setText("▶️ Running 1/1 loops")
             # Bring previous app to front if enabled
             if self.activate_on_play_checkbox.isChecked():
                 self.activate_previous_app()
         else:
-            self.status_bar.showMessage("No macro to play or already playing")
+            self.status_label.setText("No macro to play or already playing")
 
     def play_infinite_gui(self):
         """Prepare and play current macro in infinite loop until stopped."""
+        if self.app.recorder.recording:
+            self.status_label.setText("Cannot play while recording")
+            return
         if self.app.macro_data and not self.app.player.playing:
             # Prepare UI and hotkeys
             self._prepare_for_playback()
 
             self.app.play_infinite()
-            self.status_bar.showMessage("🔁 Running 1/∞ loops")
-            if not self.play_progress_timer.isActive():
-                self.play_progress_timer.start(200)
+            self.status_label.setText("🔁 Running 1/∞ loops")
             # Bring previous app to front if enabled
             if self.activate_on_play_checkbox.isChecked():
                 self.activate_previous_app()
         else:
-            self.status_bar.showMessage("No macro to play or already playing")
+            self.status_label.setText("No macro to play or already playing")
 
+    @pyqtSlot()
     def stop_playback_gui(self):
         """Stop playback, clean up hotkeys, and restore window state."""
         if self.app.player.playing:
             self.app.stop_playback()
-            self.status_bar.showMessage("⏹️ Playback stopped")
-            if self.play_progress_timer.isActive():
-                self.play_progress_timer.stop()
+            self.status_label.setText("⏹️ Playback stopped")
             self._cleanup_after_playback()
         else:
-            self.status_bar.showMessage("Not currently playing")
+            self.status_label.setText("Not currently playing")
 
     def play_x(self):
         """Play current macro a user-specified number of loops."""
+        if self.app.recorder.recording:
+            self.status_label.setText("Cannot play while recording")
+            return
         try:
             loops = int(self.loop_entry.text())
             if self.app.macro_data and not self.app.player.playing:
@@ -677,96 +889,156 @@ class MacroGUI(QMainWindow):
                 self._prepare_for_playback()
 
                 self.app.play_x_times(loops)
-                self.status_bar.showMessage(f"🔄 Running 1/{loops} loops")
-                if not self.play_progress_timer.isActive():
-                    self.play_progress_timer.start(200)
+                self.status_label.setText(f"🔄 Running 1/{loops} loops")
                 # Bring previous app to front if enabled
                 if self.activate_on_play_checkbox.isChecked():
                     self.activate_previous_app()
             else:
-                self.status_bar.showMessage("No macro to play or already playing")
+                self.status_label.setText("No macro to play or already playing")
         except ValueError:
-            self.status_bar.showMessage("Invalid loop count")
-
-    def update_play_progress(self):
-        """Update loop progress in the status bar; restore window when finished."""
-        player = self.app.player
-        if not player.playing:
-            if self.play_progress_timer.isActive():
-                self.play_progress_timer.stop()
-            self._cleanup_after_playback()
-            return
+            self.status_label.setText("Invalid loop count")
+
+    def _on_loop_advanced(self, current, total):
+        """Show loop progress in the status bar when the player starts a loop."""
         # Ensure at least 1 is shown when first loop starts
-        current = player.current_loop or 1
-        total = player.total_loops
+        current = current or 1
         if total == -1:
-            self.status_bar.showMessage(f"🔁 Running {current}/∞ loops")
+            self.status_label.setText(f"🔁 Running {current}/∞ loops")
         else:
-            self.status_bar.showMessage(f"🔄 Running {current}/{total} loops")
+            self.status_label.setText(f"🔄 Running {current}/{total} loops")
+
+    def _on_playback_finished(self):
+        """Restore window state once the player has finished on its own."""
+        if self._playback_active:
+            self._cleanup_after_playback()
 
     def save_macro(self):
         """Save the current macro to a JSON file chosen by the user."""
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Save Macro", "", "JSON files (*.json)"
+        if self._file_task_active:
+            self.status_label.setText("A macro file operation is still running")
+            return
+        filename = self._choose_macro_file(
+            "Save Macro", QFileDialog.AcceptMode.AcceptSave
         )
         if filename:
             if not filename.endswith(".json"):
                 filename += ".json"
-            with open(filename, "w") as f:
-                json.dump(list(self.app.macro_data or []), f, indent=2)
-            self.status_bar.showMessage(f"Saved to {filename}")
+            # Snapshot on the GUI thread; serialization runs on the thread pool
+            events = list(self.app.macro_data or [])
+            self._file_task_active = True
+            QThreadPool.globalInstance().start(
+                SaveMacroTask(self.app.recorder, filename, events, self.file_signals)
+            )
+            self.status_label.setText("Saving…")
 
     def load_macro(self):
         """Load a macro from a JSON file chosen by the user."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Load Macro", "", "JSON files (*.json)"
+        if self._file_task_active:
+            self.status_label.setText("A macro file operation is still running")
+            return
+        filename = self._choose_macro_file(
+            "Load Macro", QFileDialog.AcceptMode.AcceptOpen
         )
         if filename:
-            self.app.recorder.load_macro(filename)
-            with self.app.recorder._events_lock:
-                self.app.macro_data = self.app.recorder.events.copy()
-            self.status_bar.showMessage(f"Loaded {len(self.app.macro_data)} events")
+            self._file_task_active = True
+            QThreadPool.globalInstance().start(
+                LoadMacroTask(self.app.recorder, filename, self.file_signals)
+            )
+            self.status_label.setText("Loading…")
+
+    def _on_macro_saved(self, filename):
+        """Report a completed background save."""
+        self._file_task_active = False
+        self.status_label.setText(f"Saved to {filename}")
+
+    def _on_macro_loaded(self, events):
+        """Adopt the events parsed by a background load task."""
+        self._file_task_active = False
+        self.app.macro_data = events
+        self.status_label.setText(f"Loaded {len(events)} events")
+
+    def _on_macro_file_failed(self, message):
+        """Report a failed background save or load."""
+        self._file_task_active = False
+        self.status_label.setText(message)
+
+    def _choose_macro_file(self, title, accept_mode):
+        """Run the shared macro file dialog; return the chosen path or ""."""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setNameFilters(["JSON files (*.json)"])
+            self._file_dialog.setDefaultSuffix("json")
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setAcceptMode(accept_mode)
+        if accept_mode == QFileDialog.AcceptMode.AcceptSave:
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        else:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        if dialog.exec() and dialog.selectedFiles():
+            return dialog.selectedFiles()[0]
+        return ""
+
+    def _queue_recorder_events(self, events):
+        """Buffer events from a recorder thread and wake the GUI if needed."""
+        if not self._log_visible:
+            return
+        self._pending_events.extend(events)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.recorder_signals.events_available.emit()
+
+    def on_new_events(self):
+        """Drain buffered recorder events into the log console in real-time"""
+        # Clear the flag before draining so events queued meanwhile re-signal
+        self._drain_scheduled = False
+        pending = self._pending_events
+        # Nothing to show while the log is hidden; events stay in the recorder
+        if not self.app.recorder.recording or not self.log_console.isVisible():
+            pending.clear()
+            return
 
-    def update_log(self):
-        """Update the log console with new events in real-time"""
-        if not self.app.recorder.recording:
+        # Events older than a full log would be trimmed right away
+        excess = len(pending) - self.log_model.max_rows
+        if excess > 0:
+            self.log_model.skip_events([pending.popleft() for _ in range(excess)])
+        chunk = min(len(pending), LOG_FLUSH_CHUNK)
+        new_events = [pending.popleft() for _ in range(chunk)]
+        if not new_events:
             return
 
-        new_events, current_count = self.app.recorder.get_events_since(self.last_event_count)
-        if new_events:
-            # Add new events to log
-            any_added = False
-            for event in new_events:
-                # Handle control stop request coming from subprocess (F2)
-                if event.get("type") == "__stop_request__":
-                    # Stop and restore window
-                    self.stop_recording_gui()
-                    # Skip logging this control event
-                    continue
-                # Add event to model (handles filtering internally)
-                added = self.log_model.add_event(event)
-                if added:
-                    any_added = True
-            if any_added:
-                # Auto-scroll to bottom once after processing batch
-                self.log_console.scrollToBottom()
-
-            self.last_event_count = current_count
+        at_bottom = self._log_at_bottom()
+        # One model insert per chunk rather than one per event
+        if self.log_model.add_events(new_events) and at_bottom:
+            # Auto-scroll once after processing batch, unless the user scrolled up
+            self._schedule_scroll_to_end()
+
+        if pending:
+            # Let paint and input events run before inserting the next chunk
+            self._drain_scheduled = True
+            QTimer.singleShot(0, self.on_new_events)
 
     def toggle_log_console(self):
         """Toggle the visibility of the log console"""
-        if self.log_section.isVisible():
-            self.log_section.hide()
-            self.toggle_log_action.blockSignals(True)
-            self.toggle_log_action.setText("Show Log")
-            self.toggle_log_action.setChecked(False)
-            self.toggle_log_action.blockSignals(False)
+        self._set_log_visible(not self.log_section.isVisible())
+
+    def _set_log_visible(self, visible):
+        """Show or hide the log console and keep the toolbar action in sync.
+
+        While hidden, recorder events are not buffered or formatted at all.
+        """
+        self._log_visible = visible
+        if visible:
+            if not self.log_section.isVisible():
+                self.log_section.show()
         else:
-            self.log_section.show()
-            self.toggle_log_action.blockSignals(True)
-            self.toggle_log_action.setText("Hide Log")
-            self.toggle_log_action.setChecked(True)
-            self.toggle_log_action.blockSignals(False)
+            if self.log_section.isVisible():
+                self.log_section.hide()
+            self._pending_events.clear()
+        self.toggle_log_action.blockSignals(True)
+        self.toggle_log_action.setText("Hide Log" if visible else "Show Log")
+        self.toggle_log_action.setChecked(visible)
+        self.toggle_log_action.blockSignals(False)
 
     def clear_log(self):
         """Clear the log console"""
@@ -780,18 +1052,74 @@ class MacroGUI(QMainWindow):
         Args:
             message: String message to append (can be a status/system message)
         """
-        self.log_model.append_system_message(message)
-        # Auto-scroll to bottom
+        self._log_append_many([message])
+
+    def _log_append_many(self, messages):
+        """Append several messages to the log console in one batch."""
+        if not messages:
+            return
+        at_bottom = self._log_at_bottom()
+        self.log_model.append_system_messages(messages)
+        # Auto-scroll to bottom unless the user scrolled up
+        if at_bottom:
+            self._schedule_scroll_to_end()
+
+    def _append_troubleshooting(self, error):
+        """Log a recording failure followed by permission troubleshooting tips."""
+        self._log_append_many([f"❌ Recording Failed: {error}", "", *_TROUBLESHOOTING])
+
+    def _schedule_scroll_to_end(self):
+        """Scroll the log to the end once the current event loop pass is done.
+
+        Several inserts in the same pass share one scroll, and the scroll bar
+        range is only read after the view has laid out all new rows.
+        """
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(0, self._flush_scroll)
+
+    def _flush_scroll(self):
+        self._scroll_pending = False
         self.log_console.scrollToBottom()
 
+    def _log_at_bottom(self):
+        """Return True if the log view is scrolled to (or near) the bottom."""
+        # An already scheduled scroll ends at the bottom; skip the layout query
+        if self._scroll_pending:
+            return True
+        scrollbar = self.log_console.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum() - 4
+
     def _log_clear(self):
         """Clear the log console completely."""
         self.log_model.clear_events()
 
     def capture_prev_front_app(self):
-        """Capture the currently frontmost app (macOS) to reactivate later when recording starts."""
+        """Capture the currently frontmost app (macOS) to reactivate later when recording starts.
+
+        Uses AppKit when available to avoid spawning osascript.
+        """
         if sys.platform != "darwin":
             return
+        if NSWorkspace is not None:
+            try:
+                app = NSWorkspace.sharedWorkspace().frontmostApplication()
+                if app is not None:
+                    self._prev_front_app = app
+                    self.prev_front_app_name = app.localizedName()
+                return
+            except Exception:
+                pass
+        # osascript takes tens of milliseconds; don't block the GUI thread on it
+        threading.Thread(
+            target=self._capture_prev_front_app_osascript,
+            name="FrontAppCapture",
+            daemon=True,
+        ).start()
+
+    def _capture_prev_front_app_osascript(self):
+        """Query the frontmost app name via osascript (runs on a worker thread)."""
         try:
             name = (
                 subprocess.check_output(
@@ -816,52 +1144,72 @@ class MacroGUI(QMainWindow):
         """
         if sys.platform != "darwin":
             return
+        if self._prev_front_app is not None:
+            try:
+                if self._prev_front_app.activateWithOptions_(
+                    NSApplicationActivateIgnoringOtherApps
+                ):
+                    return
+            except Exception:
+                pass
+        if self.prev_front_app_name:
+            script = f'tell application "{self.prev_front_app_name}" to activate'
+        else:
+            # Fallback: single Cmd+Tab to previous app in MRU list
+            script = 'tell application "System Events" to key code 48 using {command down}'
+        # Fire and forget so the record/play start path never waits on osascript
+        threading.Thread(
+            target=self._run_osascript, args=(script,), name="ActivateApp", daemon=True
+        ).start()
+
+    @staticmethod
+    def _run_osascript(script):
+        """Run an AppleScript snippet, ignoring failures."""
         try:
-            if self.prev_front_app_name:
-                subprocess.run(
-                    [
-                        "osascript",
-                        "-e",
-                        f'tell application "{self.prev_front_app_name}" to activate',
-                    ],
-                    check=False,
-                )
-            else:
-                # Fallback: single Cmd+Tab to previous app in MRU list
-                subprocess.run(
-                    [
-                        "osascript",
-                        "-e",
-                        'tell application "System Events" to key code 48 using {command down}',
-                    ],
-                    check=False,
-                )
+            subprocess.run(["osascript", "-e", script], check=False)
         except Exception:
             pass
 
     def on_always_on_top_toggled(self, checked):
-        """Apply the always-on-top flag and re-show the window to take effect."""
-        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, checked)
-        # Re-show to apply flag change on macOS/Qt
-        if self.isVisible():
+        """Schedule a user-toggled flag change, coalescing rapid toggles."""
+        self._pending_on_top = checked
+        if not self._on_top_apply_scheduled:
+            self._on_top_apply_scheduled = True
+            QTimer.singleShot(50, self._apply_on_top)
+
+    def _set_on_top_now(self, on_top):
+        """Check the action and apply always-on-top without the debounce.
+
+        Record/play paths use this so the window flags settle before
+        activate_previous_app() hands focus to the target app.
+        """
+        self.always_on_top_action.blockSignals(True)
+        self.always_on_top_action.setChecked(on_top)
+        self.always_on_top_action.blockSignals(False)
+        self._pending_on_top = on_top
+        self._apply_on_top()
+
+    def _apply_on_top(self):
+        """Apply the final pending always-on-top state once."""
+        self._on_top_apply_scheduled = False
+        on_top = self._pending_on_top
+        current = bool(self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint)
+        if current == on_top:
+            return
+        # Changing window flags hides the window; re-show to take effect
+        was_visible = self.isVisible()
+        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, on_top)
+        if was_visible:
             self.show()
+            # Keep the window behind other apps while recording/playing
+            if not on_top and (
+                self._restore_on_top_after_record or self._restore_on_top_after_play
+            ):
+                self.lower()
 
     def _toggle_log_from_action(self, checked):
         # Reflect action state to the console visibility
-        if checked:
-            if not self.log_section.isVisible():
-                self.log_section.show()
-            self.toggle_log_action.blockSignals(True)
-            self.toggle_log_action.setText("Hide Log")
-            self.toggle_log_action.setChecked(True)
-            self.toggle_log_action.blockSignals(False)
-        else:
-            if self.log_section.isVisible():
-                self.log_section.hide()
-            self.toggle_log_action.blockSignals(True)
-            self.toggle_log_action.setText("Show Log")
-            self.toggle_log_action.setChecked(False)
-            self.toggle_log_action.blockSignals(False)
+        self._set_log_visible(checked)
 
     def _toggle_options_panel(self, checked):
         """Show or hide the advanced options pane."""
@@ -879,216 +1227,228 @@ class MacroGUI(QMainWindow):
             "F5 - Stop Playback",
         )
 
-    def _f5_signal_consumer(self):
-        """Thread that monitors the F5 signal queue from subprocess."""
-        import queue
+    def _dispatch_hotkey(self, name):
+        """Invoke the slot bound to a global hotkey on the GUI thread.
 
-        while not self._f5_consumer_stop_event.is_set():
+        Safe to call from any thread.
+        """
+        slot = GLOBAL_HOTKEYS.get(name)
+        if slot is not None:
+            QMetaObject.invokeMethod(self, slot, Qt.ConnectionType.QueuedConnection)
+
+    def _hotkey_consumer(self):
+        """Thread that monitors the hotkey queue from subprocess."""
+        while not self._hotkey_consumer_stop_event.is_set():
             try:
-                signal = self._f5_signal_queue.get(timeout=0.1)
-                if signal == "STOP":
-                    # Schedule stop on the Qt main thread
-                    QTimer.singleShot(0, self.stop_playback_gui)
-            except queue.Empty:
-                # Timeout - normal operation, continue polling
-                continue
+                # Block without a timeout; cleanup wakes us with a None sentinel
+                name = self._hotkey_queue.get()
+                if name is None:
+                    break
+                self._dispatch_hotkey(name)
             except (OSError, ValueError):
                 # Queue closed or invalid state - exit gracefully
-                logging.debug("F5 consumer thread: Queue closed, exiting")
+                logging.debug("Hotkey consumer thread: Queue closed, exiting")
                 break
             except Exception:
                 # Unexpected error - log and exit to avoid infinite loop
-                logging.exception("F5 consumer thread: Unexpected error")
+                logging.exception("Hotkey consumer thread: Unexpected error")
                 break
 
-    def _start_playback_hotkeys(self):
-        """Start a global listener that maps F5 to stop playback."""
+    def _start_global_hotkeys(self):
+        """Start the single global listener for GLOBAL_HOTKEYS."""
         # Check if already running
-        if self._play_hotkey_listener is not None or self._f5_subprocess is not None:
+        if self._hotkey_listener is not None or self._hotkey_subprocess is not None:
             return
 
         # macOS: use subprocess to avoid CGEventTap conflict with PyQt6
         if sys.platform == "darwin":
             try:
                 mp_ctx = mp.get_context("spawn")
-                self._f5_signal_queue = mp_ctx.Queue(maxsize=10)
-                self._f5_stop_event = mp_ctx.Event()
+                self._hotkey_queue = mp_ctx.Queue(maxsize=10)
+                self._hotkey_stop_event = mp_ctx.Event()
 
                 # Start subprocess
-                self._f5_subprocess = mp_ctx.Process(
-                    target=_f5_hotkey_subprocess,
-                    args=(self._f5_signal_queue, self._f5_stop_event),
+                self._hotkey_subprocess = mp_ctx.Process(
+                    target=_hotkey_subprocess,
+                    args=(self._hotkey_queue, self._hotkey_stop_event),
                 )
-                self._f5_subprocess.start()
+                self._hotkey_subprocess.start()
 
                 # Start consumer thread to monitor queue
-                self._f5_consumer_stop_event = threading.Event()
-                self._f5_consumer_thread = threading.Thread(
-                    target=self._f5_signal_consumer,
-                    name="F5HotkeyConsumer",
+                self._hotkey_consumer_stop_event = threading.Event()
+                self._hotkey_consumer_thread = threading.Thread(
+                    target=self._hotkey_consumer,
+                    name="HotkeyConsumer",
+                    # Never hold up interpreter exit if the wake-up sentinel
+                    # could not be queued
+                    daemon=True,
                 )
-                self._f5_consumer_thread.start()
+                self._hotkey_consumer_thread.start()
 
-                logging.debug("Started F5 hotkey subprocess on macOS")
+                logging.debug("Started hotkey subprocess on macOS")
             except Exception as e:
-                logging.warning("Failed to start F5 hotkey subprocess: %s", e)
-                self._cleanup_f5_subprocess()
+                logging.warning("Failed to start hotkey subprocess: %s", e)
+                self._cleanup_hotkey_subprocess()
         else:
             # Windows/Linux: use in-process listener (no CGEventTap conflict)
             def on_key_press(key):
                 try:
-                    if key == keyboard.Key.f5:
-                        # Schedule stop on the Qt main thread
-                        QTimer.singleShot(0, self.stop_playback_gui)
+                    self._dispatch_hotkey(getattr(key, "name", None))
                 except Exception:
                     logging.exception("Error in global hotkey on_key_press handler")
 
             try:
-                self._play_hotkey_listener = keyboard.Listener(on_press=on_key_press)
-                self._play_hotkey_listener.start()
+                self._hotkey_listener = keyboard.Listener(on_press=on_key_press)
+                self._hotkey_listener.start()
             except Exception as e:
-                # If listener fails, continue without global hotkey but log for diagnostics
+                # If listener fails, continue without global hotkeys but log for diagnostics
                 logging.warning("Failed to start global hotkey listener: %s", e)
-                self._play_hotkey_listener = None
+                self._hotkey_listener = None
 
-    def _cleanup_f5_subprocess(self):
-        """Clean up the F5 hotkey subprocess and associated resources."""
+    def _cleanup_hotkey_subprocess(self):
+        """Clean up the hotkey subprocess and associated resources."""
         # Stop consumer thread
-        if self._f5_consumer_stop_event is not None:
-            self._f5_consumer_stop_event.set()
-        if self._f5_consumer_thread is not None and self._f5_consumer_thread.is_alive():
-            self._f5_consumer_thread.join(timeout=1.0)
-        if self._f5_consumer_thread.is_alive():
-            logging.warning("F5 consumer thread did not stop within timeout")
+        if self._hotkey_consumer_stop_event is not None:
+            self._hotkey_consumer_stop_event.set()
+        if self._hotkey_queue is not None:
+            try:
+                self._hotkey_queue.put_nowait(None)
+            except Exception:
+                logging.debug("Could not wake hotkey consumer thread")
+        if self._hotkey_consumer_thread is not None and self._hotkey_consumer_thread.is_alive():
+            self._hotkey_consumer_thread.join(timeout=1.0)
+            if self._hotkey_consumer_thread.is_alive():
+                logging.warning("Hotkey consumer thread did not stop within timeout")
         # Stop subprocess with verification
-        if self._f5_stop_event is not None:
-            self._f5_stop_event.set()
+        if self._hotkey_stop_event is not None:
+            self._hotkey_stop_event.set()
 
-        if self._f5_subprocess is not None and self._f5_subprocess.is_alive():
+        if self._hotkey_subprocess is not None and self._hotkey_subprocess.is_alive():
             # First attempt: wait for graceful shutdown
-            self._f5_subprocess.join(timeout=1.0)
+            self._hotkey_subprocess.join(timeout=1.0)
 
             # Second attempt: terminate if still alive
-            if self._f5_subprocess.is_alive():
-                self._f5_subprocess.terminate()
-                self._f5_subprocess.join(timeout=0.5)
+            if self._hotkey_subprocess.is_alive():
+                self._hotkey_subprocess.terminate()
+                self._hotkey_subprocess.join(timeout=0.5)
 
             # Third attempt: force kill if still alive
-            if self._f5_subprocess.is_alive():
-                if hasattr(os, 'kill') and hasattr(self._f5_subprocess, 'pid'):
+            if self._hotkey_subprocess.is_alive():
+                if hasattr(os, 'kill') and hasattr(self._hotkey_subprocess, 'pid'):
                     # POSIX systems
                     try:
-                        os.kill(self._f5_subprocess.pid, signal.SIGKILL)
+                        os.kill(self._hotkey_subprocess.pid, signal.SIGKILL)
                     except (OSError, ProcessLookupError):
                         pass  # Process already terminated
                 else:
                     # Fallback for non-POSIX or if kill() fails
-                    self._f5_subprocess.kill()
+                    self._hotkey_subprocess.kill()
 
-                self._f5_subprocess.join(timeout=0.5)
+                self._hotkey_subprocess.join(timeout=0.5)
 
             # Verify termination
-            if self._f5_subprocess.exitcode is None:
-                logging.warning("F5 subprocess did not terminate cleanly (exitcode: %s)",
-                              self._f5_subprocess.exitcode)
+            if self._hotkey_subprocess.exitcode is None:
+                logging.warning("Hotkey subprocess did not terminate cleanly (exitcode: %s)",
+                              self._hotkey_subprocess.exitcode)
             else:
-                logging.debug("F5 subprocess terminated with exitcode: %s",
-                            self._f5_subprocess.exitcode)
+                logging.debug("Hotkey subprocess terminated with exitcode: %s",
+                            self._hotkey_subprocess.exitcode)
 
         # Close and cleanup the queue
-        if self._f5_signal_queue is not None:
+        if self._hotkey_queue is not None:
             try:
-                self._f5_signal_queue.close()
+                self._hotkey_queue.close()
                 # Release background thread resources for multiprocessing.Queue
-                if hasattr(self._f5_signal_queue, 'join_thread'):
-                    self._f5_signal_queue.join_thread()
-                logging.debug("F5 signal queue closed and joined")
+                if hasattr(self._hotkey_queue, 'join_thread'):
+                    self._hotkey_queue.join_thread()
+                logging.debug("Hotkey queue closed and joined")
             except Exception as e:
-                logging.warning("Error closing F5 signal queue: %s", e)
+                logging.warning("Error closing hotkey queue: %s", e)
 
         # Clear references
-        self._f5_subprocess = None
-        self._f5_stop_event = None
-        self._f5_signal_queue = None
-        self._f5_consumer_thread = None
-        self._f5_consumer_stop_event = None
-
-    def _stop_playback_hotkeys(self):
-        """Stop and clear the global F5 playback stop listener if present."""
+        self._hotkey_subprocess = None
+        self._hotkey_stop_event = None
+        self._hotkey_queue = None
+        self._hotkey_consumer_thread = None
+        self._hotkey_consumer_stop_event = None
+
+    def _stop_global_hotkeys(self):
+        """Stop and clear the global hotkey listener if present."""
         # macOS subprocess
-        if self._f5_subprocess is not None:
+        if self._hotkey_subprocess is not None:
             try:
-                self._cleanup_f5_subprocess()
+                self._cleanup_hotkey_subprocess()
             except Exception:
-                logging.exception("Error stopping F5 hotkey subprocess")
+                logging.exception("Error stopping hotkey subprocess")
 
         # Windows/Linux in-process listener
-        if self._play_hotkey_listener is not None:
+        if self._hotkey_listener is not None:
             try:
-                self._play_hotkey_listener.stop()
+                self._hotkey_listener.stop()
             except Exception:
                 logging.exception("Error stopping global hotkey listener")
             finally:
-                self._play_hotkey_listener = None
+                self._hotkey_listener = None
 
     def _cleanup_after_playback(self):
-        # Beep to signal completion and stop any global hotkey listener
-        try:
-            QApplication.beep()
-        except Exception:
-            pass
-        self._stop_playback_hotkeys()
+        self._playback_active = False
+        # Beep (at most once per run) to signal completion
+        if self.beep_on_complete_checkbox.isChecked() and not self._beeped_for_this_run:
+            self._beeped_for_this_run = True
+            try:
+                QApplication.beep()
+            except Exception:
+                pass
         # Restore window if it was backgrounded for playback
         if self._restore_on_top_after_play:
             self._restore_on_top_after_play = False
             if not self.always_on_top_action.isChecked():
-                self.always_on_top_action.setChecked(True)
+                self._set_on_top_now(True)
             self.show()
             self.raise_()
             self.activateWindow()
 
     def _prepare_for_playback(self):
-        """Lower window, manage top-most state, and enable F5 stop hotkey."""
-        # Send window to background and manage always-on-top, then enable F5 stop
+        """Lower window and manage top-most state before playback."""
+        self._playback_active = True
+        self._beeped_for_this_run = False
+        # Send window to background and manage always-on-top
         if self.isVisible():
             if self.always_on_top_action.isChecked():
                 self._restore_on_top_after_play = True
-                self.always_on_top_action.setChecked(False)
+                self._set_on_top_now(False)
             self.lower()
-        self._start_playback_hotkeys()
 
+    @pyqtSlot()
     def _start_recording_delayed(self):
         """Start recording after PyQt6 event loop is fully initialized"""
+        # Paint the "Initializing" status and log lines now: starting the
+        # listeners blocks the GUI thread until they are ready
+        self.status_label.repaint()
+        self.log_console.viewport().repaint()
         try:
             self.app.start_recording()
+            # MacroApp silently ignores the request while playing; fail fast
+            # instead of reporting a session that never started
+            if not self.app.recorder.recording:
+                raise RuntimeError("recorder did not start")
 
             # Recording started successfully
-            self.status_bar.showMessage("🔴 Recording started successfully!")
-            self._log_append("✅ Recording Session Started Successfully")
-            self._log_append("Monitoring mouse and keyboard events...")
-
-            # Start the log update timer
-            if not self.log_timer.isActive():
-                self.log_timer.start(100)
+            self.status_label.setText("🔴 Recording started successfully!")
+            self._log_append_many(
+                [
+                    "✅ Recording Session Started Successfully",
+                    "Monitoring mouse and keyboard events...",
+                ]
+            )
 
         except Exception as e:
             # Recording failed - show error and clean up
             error_msg = f"❌ Failed to start recording: {str(e)}"
             print(error_msg)
-            self.status_bar.showMessage("❌ Recording failed - Check permissions")
+            self.status_label.setText("❌ Recording failed - Check permissions")
 
-            self._log_append(f"❌ Recording Failed: {str(e)}")
-            self._log_append("")
-            self._log_append("💡 Troubleshooting Tips:")
-            self._log_append(
-                "• Go to System Preferences → Security & Privacy → Privacy"
-            )
-            self._log_append(
-                "• Click 'Accessibility' and add your Terminal or Python"
-            )
-            self._log_append(
-                "• Restart the application after granting permissions"
-            )
+            self._append_troubleshooting(e)
 
             # Reset button state
             self.toggle_log_action.blockSignals(True)
@@ -1111,21 +1471,16 @@ class MacroGUI(QMainWindow):
         if self.app.recorder.recording:
             self.app.stop_recording()
 
-        # Clean up F5 hotkey resources
-        self._stop_playback_hotkeys()
-
-        # Stop timers
-        if self.log_timer.isActive():
-            self.log_timer.stop()
-        if self.play_progress_timer.isActive():
-            self.play_progress_timer.stop()
+        # Clean up global hotkey resources
+        self._stop_global_hotkeys()
 
         # Accept the close event
         event.accept()
 
     def run(self):
-        """Capture previous app (macOS) and show the GUI window."""
-        # Don't setup global hotkeys in GUI mode - they conflict with PyQt6
+        """Capture previous app (macOS), start global hotkeys, and show the window."""
+        # MacroApp's CLI hotkeys conflict with PyQt6; use the GUI's own hook
+        self._start_global_hotkeys()
         # Capture the app currently in front, so we can reactivate it when we hide ourselves
         self.capture_prev_front_app()
         self.show()
@@ -6,7 +6,7 @@ for malformed events.
 import time
 import logging
 from pynput.mouse import Button, Controller as MouseController
-from pynput.keyboard import Key, Controller as KeyboardController
+from pynput.keyboard import Key, KeyCode, Controller as KeyboardController
 
 
 class MacroPlayer:
@@ -19,6 +19,14 @@ class MacroPlayer:
         self.stop_flag = False
         self.current_loop = 0
         self.total_loops = 0  # -1 for infinite
+        # Optional callables notified from the playback thread:
+        # loop_callback(current_loop, total_loops) when a new loop starts and
+        # finished_callback() once playback has ended.
+        self.loop_callback = None
+        self.finished_callback = None
+        # Recorded button/key string -> parsed pynput object
+        self._button_cache = {}
+        self._key_cache = {}
 
     def play_macro(self, events, loops=1, speed=1.0):
         """Play a list of recorded events.
@@ -32,105 +40,196 @@ class MacroPlayer:
         self.current_loop = 0
         self.total_loops = loops
 
-        loop_count = 0
-        while (loops == -1 or loop_count < loops) and not self.stop_flag:
-            # Update loop index at the beginning of each iteration so UI shows 1-based progress
-            self.current_loop = loop_count + 1
-            last_time = 0
-
-            for event in events:
-                if self.stop_flag:
-                    break
-
-                # Skip control/meta events or events missing timing
-                event_type = event.get("type")
-                if not event_type:
-                    logging.debug("Skipping event without type")
-                    continue
-                if event_type == "__stop_request__":
-                    continue
-                event_time = event.get("time")
-                if not isinstance(event_time, (int, float)):
+        try:
+            # Validate once up front rather than on every loop, and scale the
+            # event times by the speed once instead of per event per loop
+            schedule = [
+                (event_time / speed, handler, args)
+                for event_time, handler, args in self._build_schedule(events)
+            ]
+            now = time.perf_counter
+            sleep = time.sleep
+
+            loop_count = 0
+            while (loops == -1 or loop_count < loops) and not self.stop_flag:
+                # Update loop index at the beginning of each iteration so UI
+                # shows 1-based progress
+                self.current_loop = loop_count + 1
+                if self.loop_callback is not None:
+                    self.loop_callback(self.current_loop, loops)
+                # Sleep to absolute deadlines from the loop start so oversleeps
+                # and handler time do not accumulate as drift over long macros
+                loop_start = now()
+
+                for offset, handler, args in schedule:
+                    if self.stop_flag:
+                        break
+
+                    # Wait for the appropriate time
+                    wait_time = loop_start + offset - now()
+                    if wait_time > 0:
+                        sleep(wait_time)
+
+                    # Execute the event
+                    handler(*args)
+
+                loop_count += 1
+        finally:
+            # Also on a handler error, so callers waiting on
+            # finished_callback are never left in the playing state
+            self.playing = False
+            if self.finished_callback is not None:
+                self.finished_callback()
+
+    def _build_schedule(self, events):
+        """Return (time, handler, args) entries for the events that can be played.
+
+        Validation and button/key parsing happen once here, so each loop only
+        sleeps and calls the precompiled handler. Moves to the position the
+        cursor was last sent to are dropped as no-ops.
+        """
+        schedule = []
+        last_pos = None
+        for event in events:
+            # Skip control/meta events or events missing timing
+            event_type = event.get("type")
+            if not event_type:
+                logging.debug("Skipping event without type")
+                continue
+            # Older recordings may contain F2 stop-request control events
+            if event_type == "__stop_request__":
+                continue
+            event_time = event.get("time")
+            if not isinstance(event_time, (int, float)):
+                continue
+            compiled = self._compile_event(event)
+            if compiled is None:
+                continue
+            handler, args = compiled
+            if handler == self._move_to:
+                if args[0] == last_pos:
                     continue
-
-                # Wait for the appropriate time
-                wait_time = (event_time - last_time) / speed
-                if wait_time > 0:
-                    time.sleep(wait_time)
-                last_time = event_time
-
-                # Execute the event
-                self.execute_event(event)
-
-            loop_count += 1
-
-        self.playing = False
+                last_pos = args[0]
+            elif handler == self._click and args[0] is not None:
+                last_pos = args[0]
+            schedule.append((event_time, handler, args))
+        return schedule
 
     def execute_event(self, event):
         """Execute a single event dict if it contains required fields."""
-        event_type = event.get("type", "")
-
-        if event_type == "mouse_move":
-            x = event.get("x")
-            y = event.get("y")
-            if isinstance(x, (int, float)) and isinstance(y, (int, float)):
-                self.mouse.position = (x, y)
-            else:
-                logging.debug("mouse_move missing/invalid coordinates; skipping")
-
-        elif event_type == "mouse_click":
-            button_str = event.get("button")
-            pressed = event.get("pressed")
-            if button_str is None or pressed is None:
-                logging.debug("mouse_click missing button/pressed; skipping")
-                return
-            button = self.parse_button(button_str)
-            if pressed:
-                self.mouse.press(button)
-            else:
-                self.mouse.release(button)
-
-        elif event_type == "mouse_scroll":
-            dx = event.get("dx", 0)
-            dy = event.get("dy", 0)
-            if not isinstance(dx, (int, float)):
-                dx = 0
-            if not isinstance(dy, (int, float)):
-                dy = 0
-            self.mouse.scroll(dx, dy)
-
-        elif event_type == "key_press":
-            key_str = event.get("key")
-            if key_str is None:
-                logging.debug("key_press missing key; skipping")
-                return
-            key = self.parse_key(key_str)
-            self.keyboard.press(key)
-
-        elif event_type == "key_release":
-            key_str = event.get("key")
-            if key_str is None:
-                logging.debug("key_release missing key; skipping")
-                return
-            key = self.parse_key(key_str)
-            self.keyboard.release(key)
+        compiled = self._compile_event(event)
+        if compiled is not None:
+            handler, args = compiled
+            handler(*args)
+
+    def _compile_event(self, event):
+        """Resolve an event dict to a (handler, args) pair, or None if invalid."""
+        compiler = self._COMPILERS.get(event.get("type", ""))
+        if compiler is None:
+            return None
+        return compiler(self, event)
+
+    def _compile_mouse_move(self, event):
+        x = event.get("x")
+        y = event.get("y")
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            return self._move_to, ((x, y),)
+        logging.debug("mouse_move missing/invalid coordinates; skipping")
+        return None
+
+    def _compile_mouse_click(self, event):
+        button_str = event.get("button")
+        pressed = event.get("pressed")
+        if button_str is None or pressed is None:
+            logging.debug("mouse_click missing button/pressed; skipping")
+            return None
+        button = self.parse_button(button_str)
+        # Small moves are not recorded, so place the cursor at the exact
+        # click position before pressing/releasing
+        x = event.get("x")
+        y = event.get("y")
+        position = None
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            position = (x, y)
+        return self._click, (position, button, bool(pressed))
+
+    def _compile_mouse_scroll(self, event):
+        dx = event.get("dx", 0)
+        dy = event.get("dy", 0)
+        if not isinstance(dx, (int, float)):
+            dx = 0
+        if not isinstance(dy, (int, float)):
+            dy = 0
+        return self.mouse.scroll, (dx, dy)
+
+    def _compile_key_press(self, event):
+        key_str = event.get("key")
+        if key_str is None:
+            logging.debug("key_press missing key; skipping")
+            return None
+        return self.keyboard.press, (self.parse_key(key_str),)
+
+    def _compile_key_release(self, event):
+        key_str = event.get("key")
+        if key_str is None:
+            logging.debug("key_release missing key; skipping")
+            return None
+        return self.keyboard.release, (self.parse_key(key_str),)
+
+    # Event type -> compiler, one dict lookup instead of an if/elif chain
+    _COMPILERS = {
+        "mouse_move": _compile_mouse_move,
+        "mouse_click": _compile_mouse_click,
+        "mouse_scroll": _compile_mouse_scroll,
+        "key_press": _compile_key_press,
+        "key_release": _compile_key_release,
+    }
+
+    def _move_to(self, position):
+        self.mouse.position = position
+
+    def _click(self, position, button, pressed):
+        if position is not None:
+            self.mouse.position = position
+        if pressed:
+            self.mouse.press(button)
+        else:
+            self.mouse.release(button)
 
     def parse_button(self, button_str):
         """Map a recorded button string to a pynput Button."""
-        if "left" in button_str.lower():
+        button = self._button_cache.get(button_str)
+        if button is None:
+            button = self._button_cache[button_str] = self._parse_button(button_str)
+        return button
+
+    @staticmethod
+    def _parse_button(button_str):
+        name = button_str.lower()
+        if "left" in name:
             return Button.left
-        elif "right" in button_str.lower():
+        elif "right" in name:
             return Button.right
-        elif "middle" in button_str.lower():
+        elif "middle" in name:
             return Button.middle
         return Button.left
 
     def parse_key(self, key_str):
         """Map a recorded key string to a pynput Key or plain string."""
+        key = self._key_cache.get(key_str)
+        if key is None:
+            key = self._key_cache[key_str] = self._parse_key(key_str)
+        return key
+
+    @staticmethod
+    def _parse_key(key_str):
         # Handle special keys
         if key_str.startswith("Key."):
             key_name = key_str.replace("Key.", "")
             return getattr(Key, key_name, key_str)
+        if len(key_str) == 1:
+            # Resolve now; the controller would build this KeyCode per press
+            return KeyCode.from_char(key_str)
         return key_str
 
     def stop_playback(self):
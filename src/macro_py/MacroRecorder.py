@@ -10,115 +10,184 @@ import logging
 import multiprocessing as mp
 import threading
 import queue
+from collections import deque
 from pynput import mouse, keyboard
 
 # Configure logging to help debug issues
 logging.basicConfig(level=logging.INFO)
 
+# Default for MacroRecorder.min_mouse_delta: mouse moves closer than this many
+# pixels (on both axes) to the last recorded move are dropped at capture time
+MOUSE_MOVE_THRESHOLD = 10
 
-def _macro_listener_subprocess(event_queue: mp.Queue, stop_event: mp.Event) -> None:
+
+def _is_significant_move(x, y, last_pos, min_delta=MOUSE_MOVE_THRESHOLD) -> bool:
+    """Return True if (x, y) moved more than min_delta pixels from last_pos."""
+    return (
+        last_pos is None
+        or abs(x - last_pos[0]) > min_delta
+        or abs(y - last_pos[1]) > min_delta
+    )
+
+
+# Default for MacroRecorder.move_coalesce_s: at most one mouse move is kept
+# per window of this many seconds, holding the latest position
+MOUSE_MOVE_COALESCE_S = 0.008
+
+# Default for MacroRecorder.event_queue_maxsize: capacity of the queue
+# between the macOS listener subprocess and the parent
+EVENT_QUEUE_MAXSIZE = 10000
+
+# Clicks, scrolls and keys the listener subprocess holds back while the
+# queue is full, until it has room again
+EVENT_OVERFLOW_MAXSIZE = 1000
+
+# Field order of the compact tuples the listener subprocess sends per event;
+# the parent zips them back into the same event dicts the in-process
+# listeners produce
+_EVENT_FIELDS = {
+    "mouse_move": ("type", "x", "y", "time"),
+    "mouse_click": ("type", "x", "y", "button", "pressed", "time"),
+    "mouse_scroll": ("type", "x", "y", "dx", "dy", "time"),
+    "key_press": ("type", "key", "time"),
+    "key_release": ("type", "key", "time"),
+}
+
+
+# pynput Button/Key -> interned str() of it, so callbacks don't build a new
+# name string per event
+_INPUT_NAMES = {}
+
+
+def _input_name(obj) -> str:
+    """Return the recorded name of a pynput Button or special Key."""
+    try:
+        name = _INPUT_NAMES.get(obj)
+    except TypeError:  # unhashable key object
+        return str(obj)
+    if name is None:
+        name = _INPUT_NAMES[obj] = sys.intern(str(obj))
+    return name
+
+
+def _macro_listener_subprocess(
+    event_queue: mp.Queue, stop_event: mp.Event, min_mouse_delta: int, dropped
+) -> None:
     """Run pynput listeners in an isolated subprocess (macOS workaround).
 
-    Sends event dicts to parent via event_queue. Exits when stop_event is set.
+    Sends events to parent via event_queue as tuples laid out per
+    _EVENT_FIELDS (smaller to pickle than dicts); control messages stay dicts.
+    Events lost to a full queue are counted in the shared ``dropped`` value.
+    Exits when stop_event is set.
     """
     try:
         print("🔍 [SUB] Starting listener subprocess")
-        start_time = time.time()
+        start_time = time.monotonic()
+        last_move_pos = None
+        # Events waiting for room in a full queue, sent by drain_overflow()
+        overflow = deque()
+        overflow_ready = threading.Event()
+
+        def count_dropped(count=1):
+            with dropped.get_lock():
+                dropped.value += count
+
+        def push(item):
+            """Queue an event without ever blocking the input hook thread.
+
+            On overflow a mouse move is dropped, as a later move supersedes
+            it. Clicks, scrolls and keys are held locally instead, since losing
+            one could leave a button or key held down on playback.
+            """
+            # Once events are held back, later ones queue behind them
+            if not overflow:
+                try:
+                    event_queue.put(item, block=False)
+                    return
+                except queue.Full:
+                    pass
+            if item[0] == "mouse_move":
+                count_dropped()
+                return
+            if len(overflow) >= EVENT_OVERFLOW_MAXSIZE:
+                logging.warning("[SUB] Event queue full, %s dropped", item[0])
+                count_dropped()
+                return
+            overflow.append(item)
+            overflow_ready.set()
+
+        def drain_overflow():
+            """Move held-back events into the queue as the parent frees room."""
+            while not stop_event.is_set():
+                if not overflow:
+                    overflow_ready.wait()
+                    overflow_ready.clear()
+                    continue
+                try:
+                    event_queue.put(overflow[0], timeout=0.1)
+                except queue.Full:
+                    continue
+                overflow.popleft()
 
-        # Local callbacks capture event_queue and start_time
+        sender = threading.Thread(target=drain_overflow, daemon=True)
+        sender.start()
+
+        # Local callbacks capture push() and start_time
         def on_move(x, y):
+            nonlocal last_move_pos
             try:
-                event_queue.put(
-                    {
-                        "type": "mouse_move",
-                        "x": x,
-                        "y": y,
-                        "time": time.time() - start_time,
-                    },
-                    block=False,
-                )
+                if not _is_significant_move(x, y, last_move_pos, min_mouse_delta):
+                    return
+                last_move_pos = (x, y)
+                push(("mouse_move", x, y, time.monotonic() - start_time))
             except Exception as e:
-                print(f"⚠️ [SUB] on_move error: {e}")
+                logging.warning("[SUB] on_move error: %s", e)
 
         def on_click(x, y, button, pressed):
             try:
-                event_queue.put(
-                    {
-                        "type": "mouse_click",
-                        "x": x,
-                        "y": y,
-                        "button": str(button),
-                        "pressed": pressed,
-                        "time": time.time() - start_time,
-                    },
-                    block=False,
+                push(
+                    (
+                        "mouse_click",
+                        x,
+                        y,
+                        _input_name(button),
+                        pressed,
+                        time.monotonic() - start_time,
+                    )
                 )
             except Exception as e:
-                print(f"⚠️ [SUB] on_click error: {e}")
+                logging.warning("[SUB] on_click error: %s", e)
 
         def on_scroll(x, y, dx, dy):
             try:
-                event_queue.put(
-                    {
-                        "type": "mouse_scroll",
-                        "x": x,
-                        "y": y,
-                        "dx": dx,
-                        "dy": dy,
-                        "time": time.time() - start_time,
-                    },
-                    block=False,
-                )
+                push(("mouse_scroll", x, y, dx, dy, time.monotonic() - start_time))
             except Exception as e:
-                print(f"⚠️ [SUB] on_scroll error: {e}")
+                logging.warning("[SUB] on_scroll error: %s", e)
 
         def on_key_press(key):
             try:
-                # Intercept stop hotkey (F2) as a control event to parent
+                # Don't record the stop hotkey (F2); the GUI/CLI hotkey hook
+                # handles it
                 if key == keyboard.Key.f2:
-                    try:
-                        event_queue.put(
-                            {
-                                "type": "__stop_request__",
-                                "time": time.time() - start_time,
-                            },
-                            block=False,
-                        )
-                    except Exception as e:
-                        print(f"⚠️ [SUB] stop hotkey enqueue error: {e}")
                     return
 
                 try:
                     key_name = key.char
                 except AttributeError:
-                    key_name = str(key)
-                event_queue.put(
-                    {
-                        "type": "key_press",
-                        "key": key_name,
-                        "time": time.time() - start_time,
-                    },
-                    block=False,
-                )
+                    key_name = _input_name(key)
+                push(("key_press", key_name, time.monotonic() - start_time))
             except Exception as e:
-                print(f"⚠️ [SUB] on_key_press error: {e}")
+                logging.warning("[SUB] on_key_press error: %s", e)
 
         def on_key_release(key):
             try:
                 try:
                     key_name = key.char
                 except AttributeError:
-                    key_name = str(key)
-                event_queue.put(
-                    {
-                        "type": "key_release",
-                        "key": key_name,
-                        "time": time.time() - start_time,
-                    },
-                    block=False,
-                )
+                    key_name = _input_name(key)
+                push(("key_release", key_name, time.monotonic() - start_time))
             except Exception as e:
-                print(f"⚠️ [SUB] on_key_release error: {e}")
+                logging.warning("[SUB] on_key_release error: %s", e)
 
         # Create listeners
         m_listener = mouse.Listener(
@@ -145,9 +214,8 @@ def _macro_listener_subprocess(event_queue: mp.Queue, stop_event: mp.Event) -> N
             pass
         print("🔍 [SUB] Listeners started")
 
-        # Idle until asked to stop
-        while not stop_event.is_set():
-            time.sleep(0.05)
+        # Block until asked to stop (no periodic wakeups)
+        stop_event.wait()
 
         print("🔍 [SUB] Stop event detected; stopping listeners")
         try:
@@ -158,6 +226,11 @@ def _macro_listener_subprocess(event_queue: mp.Queue, stop_event: mp.Event) -> N
             k_listener.stop()
         except Exception:
             pass
+        # Wake the sender so it sees stop_event; whatever it still holds is lost
+        overflow_ready.set()
+        sender.join(timeout=1.0)
+        if overflow:
+            count_dropped(len(overflow))
     except Exception as e:
         try:
             event_queue.put({"type": "__error__", "message": str(e)}, block=False)
@@ -175,11 +248,23 @@ def _macro_listener_subprocess(event_queue: mp.Queue, stop_event: mp.Event) -> N
 
 
 class MacroRecorder:
-    def __init__(self):
+    def __init__(self, min_mouse_delta=MOUSE_MOVE_THRESHOLD):
         self.events = []
         self._events_lock = threading.Lock()
         self.recording = False
         self.start_time = None
+        self._last_move_pos = None
+        # Minimum pixel delta for a mouse move to be recorded (0 keeps all moves)
+        self.min_mouse_delta = min_mouse_delta
+        # macOS subprocess queue capacity, and how many events the last
+        # recording lost to a full queue
+        self.event_queue_maxsize = EVENT_QUEUE_MAXSIZE
+        self.dropped_events = 0
+        self._dropped = None
+        # Consecutive moves within this many seconds collapse into the latest
+        # one (0 disables coalescing)
+        self.move_coalesce_s = MOUSE_MOVE_COALESCE_S
+        self._move_window_start = None
         self.mouse_listener = None
         self.keyboard_listener = None
         self._is_darwin = sys.platform == "darwin"
@@ -190,6 +275,61 @@ class MacroRecorder:
         self._stop_mp_event = None
         self._receiver_thread = None
         self._receiver_stop_event = None
+        # Optional callable receiving each batch (list) of newly appended events.
+        # Invoked from listener/consumer threads, so it must be thread-safe.
+        self.event_callback = None
+
+    def _store_event(self, event):
+        """Append event to self.events; the caller holds _events_lock.
+
+        A mouse move that follows a recorded move within move_coalesce_s of
+        the start of that move's window replaces it instead of being appended.
+
+        Returns:
+            bool: True if the event was appended, False if it replaced the last
+            recorded move
+        """
+        events = self.events
+        if event["type"] != "mouse_move":
+            self._move_window_start = None
+        elif (
+            self._move_window_start is not None
+            and events
+            and events[-1]["type"] == "mouse_move"
+            and event["time"] - self._move_window_start < self.move_coalesce_s
+        ):
+            events[-1] = event
+            return False
+        else:
+            self._move_window_start = event["time"]
+        events.append(event)
+        return True
+
+    def _append_event(self, event):
+        """Append an event and notify event_callback, if one is set.
+
+        Moves coalesced into the previous one are not reported, so listeners
+        see exactly the events that end up in the recording.
+        """
+        with self._events_lock:
+            appended = self._store_event(event)
+        callback = self.event_callback
+        if appended and callback is not None:
+            callback([event])
+
+    def _append_events(self, events):
+        """Append a batch of events and notify event_callback once."""
+        added = []
+        with self._events_lock:
+            for event in events:
+                if self._store_event(event):
+                    added.append(event)
+                elif added and added[-1]["type"] == "mouse_move":
+                    # Replaced a move from this same batch: report the final one
+                    added[-1] = event
+        callback = self.event_callback
+        if added and callback is not None:
+            callback(added)
 
     def start_recording(self):
         """Start recording with robust error handling"""
@@ -200,22 +340,33 @@ class MacroRecorder:
         print("🔍 [DEBUG] Resetting recorder state...")
         with self._events_lock:
             self.events = []
+            self._move_window_start = None
+        self._last_move_pos = None
+        self.dropped_events = 0
         self.recording = (
             False  # Will be set to True only if listeners start successfully
         )
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # macOS: run listeners in a subprocess to avoid CGEventTap + Qt crash
         if self._is_darwin:
             try:
                 print("🔍 [DEBUG] Using macOS subprocess strategy for listeners")
                 self._mp_ctx = mp.get_context("spawn")
-                self._event_queue = self._mp_ctx.Queue(maxsize=10000)
+                self._event_queue = self._mp_ctx.Queue(
+                    maxsize=self.event_queue_maxsize
+                )
                 self._stop_mp_event = self._mp_ctx.Event()
+                self._dropped = self._mp_ctx.Value("i", 0)
 
                 self._proc = self._mp_ctx.Process(
                     target=_macro_listener_subprocess,
-                    args=(self._event_queue, self._stop_mp_event),
+                    args=(
+                        self._event_queue,
+                        self._stop_mp_event,
+                        self.min_mouse_delta,
+                        self._dropped,
+                    ),
                     daemon=True,
                 )
                 self._proc.start()
@@ -359,6 +510,11 @@ class MacroRecorder:
             finally:
                 self._proc = None
                 self._stop_mp_event = None
+                if self._dropped is not None:
+                    self.dropped_events = self._dropped.value
+                    self._dropped = None
+                if self.dropped_events:
+                    print(f"⚠️ {self.dropped_events} events dropped (queue full)")
 
             # Drain and close queue
             try:
@@ -415,50 +571,61 @@ class MacroRecorder:
         """Consume events from subprocess and append to self.events."""
         print("🔍 [DEBUG] Queue consumer thread started")
         while True:
-            if (
+            stopping = (
                 self._receiver_stop_event is not None
                 and self._receiver_stop_event.is_set()
-            ):
-                # Still drain quickly to avoid losing tail events
-                try:
-                    item = self._event_queue.get(timeout=0.2)
-                except Exception:
+            )
+            try:
+                event_queue = self._event_queue
+                # Still drain quickly after stop to avoid losing tail events
+                items = [event_queue.get(timeout=0.2 if stopping else 0.5)]
+            except Exception:
+                if stopping:
                     break
-            else:
-                try:
-                    item = self._event_queue.get(timeout=0.5)
-                except Exception:
+                continue
+            # Take everything else already queued without blocking, so a burst
+            # costs one blocking get and one append/notify
+            try:
+                while True:
+                    items.append(event_queue.get_nowait())
+            except Exception:
+                pass
+
+            batch = []
+            child_exited = False
+            for item in items:
+                if isinstance(item, tuple):
+                    # Compact event from the listener subprocess
+                    try:
+                        if item[0] != "mouse_move":
+                            # Share one copy of repeated button/key names
+                            item = tuple(
+                                sys.intern(v) if type(v) is str else v for v in item
+                            )
+                        batch.append(dict(zip(_EVENT_FIELDS[item[0]], item)))
+                    except Exception as e:
+                        logging.warning("Error decoding event: %s", e)
+                    continue
+                if not isinstance(item, dict):
                     continue
+                msg_type = item.get("type")
+                if msg_type == "__child_exit__":
+                    child_exited = True
+                    break
+                if msg_type == "__error__":
+                    print(f"❌ Subprocess error: {item.get('message')}")
+                    continue
+                # Regular event
+                batch.append(item)
 
-            if not isinstance(item, dict):
-                continue
-            msg_type = item.get("type")
-            if msg_type == "__child_exit__":
+            if batch:
+                try:
+                    self._append_events(batch)
+                except Exception as e:
+                    print(f"⚠️ Error appending events: {e}")
+            if child_exited:
                 print("🔍 [DEBUG] Received child exit sentinel")
                 break
-            if msg_type == "__error__":
-                print(f"❌ Subprocess error: {item.get('message')}")
-                continue
-            if msg_type == "__stop_request__":
-                # Append control event so GUI can react during its timer cycle
-                try:
-                    with self._events_lock:
-                        self.events.append(
-                            {
-                                "type": "__stop_request__",
-                                "time": time.time() - (self.start_time or time.time()),
-                            }
-                        )
-                except Exception:
-                    logging.exception("Error appending control stop event")
-                continue
-
-            # Regular event
-            try:
-                with self._events_lock:
-                    self.events.append(item)
-            except Exception as e:
-                print(f"⚠️ Error appending event: {e}")
 
     def _cleanup_subprocess(self, force: bool = False) -> None:
         """Best-effort cleanup of subprocess-related resources."""
@@ -490,76 +657,74 @@ class MacroRecorder:
     def on_move(self, x, y):
         try:
             if self.recording:
-                with self._events_lock:
-                    self.events.append(
-                        {
-                            "type": "mouse_move",
-                            "x": x,
-                            "y": y,
-                            "time": time.time() - self.start_time,
-                        }
-                    )
+                if not _is_significant_move(
+                    x, y, self._last_move_pos, self.min_mouse_delta
+                ):
+                    return
+                self._last_move_pos = (x, y)
+                self._append_event(
+                    {
+                        "type": "mouse_move",
+                        "x": x,
+                        "y": y,
+                        "time": time.monotonic() - self.start_time,
+                    }
+                )
         except Exception as e:
-            print(f"⚠️ on_move error: {e}")
+            logging.warning("on_move error: %s", e)
 
     def on_click(self, x, y, button, pressed):
         try:
             if self.recording:
-                with self._events_lock:
-                    self.events.append(
-                        {
-                            "type": "mouse_click",
-                            "x": x,
-                            "y": y,
-                            "button": str(button),
-                            "pressed": pressed,
-                            "time": time.time() - self.start_time,
-                        }
-                    )
+                self._append_event(
+                    {
+                        "type": "mouse_click",
+                        "x": x,
+                        "y": y,
+                        "button": _input_name(button),
+                        "pressed": pressed,
+                        "time": time.monotonic() - self.start_time,
+                    }
+                )
         except Exception as e:
-            print(f"⚠️ on_click error: {e}")
+            logging.warning("on_click error: %s", e)
 
     def on_scroll(self, x, y, dx, dy):
         try:
             if self.recording:
-                with self._events_lock:
-                    self.events.append(
-                        {
-                            "type": "mouse_scroll",
-                            "x": x,
-                            "y": y,
-                            "dx": dx,
-                            "dy": dy,
-                            "time": time.time() - self.start_time,
-                        }
-                    )
+                self._append_event(
+                    {
+                        "type": "mouse_scroll",
+                        "x": x,
+                        "y": y,
+                        "dx": dx,
+                        "dy": dy,
+                        "time": time.monotonic() - self.start_time,
+                    }
+                )
         except Exception as e:
-            print(f"⚠️ on_scroll error: {e}")
+            logging.warning("on_scroll error: %s", e)
 
     def on_key_press(self, key):
         try:
             if self.recording:
-                # Intercept stop hotkey (F2) as a control event (non-macOS in-process)
+                # Don't record the stop hotkey (F2); the GUI/CLI hotkey hook
+                # handles it
                 if key == keyboard.Key.f2:
-                    # Compute timestamp deterministically (0.0 if start_time is None)
-                    timestamp = 0.0 if self.start_time is None else time.time() - self.start_time
-                    with self._events_lock:
-                        self.events.append({"type": "__stop_request__", "time": timestamp})
                     return
 
                 try:
                     key_name = key.char
                 except AttributeError:
-                    key_name = str(key)
-
-                with self._events_lock:
-                    self.events.append(
-                        {
-                            "type": "key_press",
-                            "key": key_name,
-                            "time": time.time() - self.start_time,
-                        }
-                    )
+                    key_name = _input_name(key)
+
+                self._append_event(
+                    {
+                        "type": "key_press",
+                        "key": key_name,
+                        "time": time.monotonic() - self.start_time,
+                    }
+                )
         except Exception:
             logging.exception("on_key_press error")
 
@@ -569,46 +734,45 @@ class MacroRecorder:
                 try:
                     key_name = key.char
                 except AttributeError:
-                    key_name = str(key)
-
-                with self._events_lock:
-                    self.events.append(
-                        {
-                            "type": "key_release",
-                            "key": key_name,
-                            "time": time.time() - self.start_time,
-                        }
-                    )
-        except Exception as e:
-            print(f"⚠️ on_key_release error: {e}")
+                    key_name = _input_name(key)
 
-    def save_macro(self, filename):
-        with self._events_lock:
-            snapshot = list(self.events)
+                self._append_event(
+                    {
+                        "type": "key_release",
+                        "key": key_name,
+                        "time": time.monotonic() - self.start_time,
+                    }
+                )
+        except Exception as e:
+            logging.warning("on_key_release error: %s", e)
+
+    def save_macro(self, filename, events=None):
+        """Write events (default: the recorded events) to filename as JSON."""
+        if events is None:
+            with self._events_lock:
+                events = list(self.events)
+        # Compact separators: indent=2 forces the pure-Python encoder before
+        # Python 3.13 and makes the file ~35% larger
+        data = json.dumps(events, separators=(",", ":"))
         with open(filename, "w") as f:
-            json.dump(snapshot, f, indent=2)
+            f.write(data)
 
     def load_macro(self, filename):
-        with open(filename, "r") as f:
-            loaded = json.load(f)
+        loaded = self.read_macro(filename)
         with self._events_lock:
             self.events = loaded
 
-    def get_events_since(self, start_index: int):
-        """Return a thread-safe slice of events since start_index and current count.
-
-        Args:
-            start_index: Starting index to slice from.
-
-        Returns:
-            tuple[list[dict], int]: (new_events, current_count)
-        """
-        with self._events_lock:
-            current_count = len(self.events)
-            if start_index < 0:
-                start_index = 0
-            if start_index > current_count:
-                start_index = current_count
-            new_events = self.events[start_index:current_count]
-        # Return a shallow copy of the slice to avoid caller mutating our list
-        return list(new_events), current_count
+    def read_macro(self, filename):
+        """Parse a macro file and return its events without touching recorder state."""
+        with open(filename, "r") as f:
+            loaded = json.load(f)
+        # json.load creates a separate string for every value; share the
+        # repeated type/button/key names like freshly recorded events do
+        intern = sys.intern
+        for event in loaded:
+            if isinstance(event, dict):
+                for field in ("type", "button", "key"):
+                    value = event.get(field)
+                    if type(value) is str:
+                        event[field] = intern(value)
+        return loaded
@@ -5,7 +5,17 @@ Macro-py: A Python macro automation tool with keyboard input and GUI support
 from .MacroRecorder import MacroRecorder
 from .MacroPlayer import MacroPlayer
 from .MacroApp import MacroApp
-from .MacroGUI import MacroGUI
 
 __version__ = "0.1.0"
 __all__ = ["MacroRecorder", "MacroPlayer", "MacroApp", "MacroGUI"]
+
+
+def __getattr__(name):
+    # MacroGUI pulls in Qt, so it is imported on first access only; that keeps
+    # `python -m macro_py --cli` free of Qt
+    if name == "MacroGUI":
+        from .MacroGUI import MacroGUI
+
+        globals()["MacroGUI"] = MacroGUI
+        return MacroGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,27 +5,48 @@ Provides both GUI and CLI interfaces.
 """
 
 import sys
-import argparse
-from PyQt6.QtWidgets import QApplication
-from .MacroGUI import MacroGUI
 from .MacroApp import MacroApp
 
 
-def main():
+VERSION_STRING = "macro-py 0.1.0"
+
+
+def _parse_args(argv):
+    """Return True for CLI mode; argparse is only loaded for other arguments."""
+    # The common invocations need no parser: no arguments, --cli or --version
+    if not argv:
+        return False
+    if argv == ["--cli"]:
+        return True
+    if argv == ["--version"]:
+        print(VERSION_STRING)
+        sys.exit(0)
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Macro Recorder and Player")
     parser.add_argument(
         "--cli", action="store_true", help="Run in CLI mode (default is GUI mode)"
     )
-    parser.add_argument("--version", action="version", version="macro-py 0.1.0")
+    parser.add_argument("--version", action="version", version=VERSION_STRING)
+    return parser.parse_args(argv).cli
+
 
-    args = parser.parse_args()
+def main():
+    cli = _parse_args(sys.argv[1:])
 
     try:
-        if args.cli:
+        # Qt and the GUI are only imported on the path that uses them
+        if cli:
             print("Starting macro-py in CLI mode...")
             app = MacroApp()
             app.run()
         else:
+            from PyQt6.QtWidgets import QApplication
+
+            # Through the package so macro_py.MacroGUI stays bound to the class
+            from . import MacroGUI
+
             print("Starting macro-py in GUI mode...")
             qt_app = QApplication(sys.argv)
             gui = MacroGUI()
@@ -0,0 +1,60 @@
+"""Tests for EventLogModel batch inserts and row trimming."""
+import pytest
+
+pytest.importorskip("pynput")
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from macro_py.MacroGUI import EventLogModel  # noqa: E402
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qt_app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def key(name, t):
+    return {"type": "key_press", "key": name, "time": t}
+
+
+def move(t):
+    return {"type": "mouse_move", "x": 1, "y": 2, "time": t}
+
+
+def rows(model):
+    return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+
+def test_add_events_inserts_formatted_rows():
+    model = EventLogModel(max_rows=10)
+
+    assert model.add_events([key("a", 0.0), key("b", 0.5)]) == 2
+    assert model.rowCount() == 2
+    assert rows(model)[1].endswith("0.500s] Key Press → b")
+
+
+def test_add_events_keeps_only_the_newest_max_rows():
+    model = EventLogModel(max_rows=3)
+    model.add_event(key("old", 0.0))
+
+    model.add_events([key(str(i), i) for i in range(5)])
+
+    assert model.rowCount() == 3
+    assert [line.rsplit(" ", 1)[1] for line in rows(model)] == ["2", "3", "4"]
+
+
+def test_skipped_moves_keep_move_numbering_continuous():
+    model = EventLogModel(max_rows=1)
+
+    model.add_events([move(0.0), move(0.1), key("a", 0.2), move(0.3)])
+
+    assert model.rowCount() == 1
+    assert "Mouse Move #3" in rows(model)[0]
+
+
+def test_skip_events_counts_only_mouse_moves():
+    model = EventLogModel()
+
+    model.skip_events([move(0.0), key("a", 0.1), move(0.2)])
+
+    assert model.mouse_move_count == 2
+    assert model.rowCount() == 0
@@ -0,0 +1,26 @@
+"""Check that the package exports its classes, not the same-named submodules.
+
+The package names its modules after the classes they define, so a careless
+import can leave e.g. macro_py.MacroRecorder bound to the module.
+"""
+import inspect
+
+import pytest
+
+pytest.importorskip("pynput")
+
+
+def test_package_exports():
+    """Top-level names resolve to classes, including after submodule imports."""
+    from macro_py import MacroApp, MacroRecorder
+
+    assert inspect.isclass(MacroApp), MacroApp
+    assert inspect.isclass(MacroRecorder), MacroRecorder
+
+    # Importing a submodule must not rebind the package attribute
+    import macro_py
+    import macro_py.MacroPlayer  # noqa: F401
+
+    for name in ("MacroRecorder", "MacroPlayer", "MacroApp"):
+        value = getattr(macro_py, name)
+        assert inspect.isclass(value), f"{name} is {value!r}"
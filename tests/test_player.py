@@ -0,0 +1,89 @@
+"""Tests for MacroPlayer schedule compilation."""
+import importlib
+
+import pytest
+
+pytest.importorskip("pynput")
+
+player_module = importlib.import_module("macro_py.MacroPlayer")
+
+
+class FakeController:
+    """Stands in for the pynput controllers, which need a display."""
+
+    position = (0, 0)
+
+    def press(self, key):
+        pass
+
+    def release(self, key):
+        pass
+
+    def scroll(self, dx, dy):
+        pass
+
+
+@pytest.fixture
+def player(monkeypatch):
+    monkeypatch.setattr(player_module, "MouseController", FakeController)
+    monkeypatch.setattr(player_module, "KeyboardController", FakeController)
+    return player_module.MacroPlayer()
+
+
+def move(x, y, t):
+    return {"type": "mouse_move", "x": x, "y": y, "time": t}
+
+
+def test_schedule_skips_control_and_untimed_events(player):
+    schedule = player._build_schedule(
+        [
+            {"type": "__stop_request__", "time": 0.1},
+            {"type": "key_press", "key": "a"},
+            {"type": "key_press", "key": "a", "time": "soon"},
+            {"time": 0.2},
+            {"type": "unknown", "time": 0.3},
+            {"type": "key_press", "key": "a", "time": 0.4},
+        ]
+    )
+
+    assert [entry[0] for entry in schedule] == [0.4]
+
+
+def test_schedule_drops_moves_to_the_current_position(player):
+    schedule = player._build_schedule(
+        [
+            move(1, 1, 0.0),
+            move(1, 1, 0.1),
+            move(2, 2, 0.2),
+            {
+                "type": "mouse_click",
+                "x": 3,
+                "y": 3,
+                "button": "Button.left",
+                "pressed": True,
+                "time": 0.3,
+            },
+            move(3, 3, 0.4),
+            move(4, 4, 0.5),
+        ]
+    )
+
+    assert [(t, handler.__name__) for t, handler, _ in schedule] == [
+        (0.0, "_move_to"),
+        (0.2, "_move_to"),
+        (0.3, "_click"),
+        (0.5, "_move_to"),
+    ]
+
+
+def test_schedule_parses_buttons_and_keys_once(player):
+    schedule = player._build_schedule(
+        [
+            {"type": "key_press", "key": "Key.space", "time": 0.0},
+            {"type": "key_release", "key": "Key.space", "time": 0.1},
+        ]
+    )
+
+    press_args, release_args = schedule[0][2], schedule[1][2]
+    assert press_args == (player_module.Key.space,)
+    assert release_args[0] is press_args[0]
@@ -0,0 +1,90 @@
+"""Tests for MacroRecorder event storage: move coalescing and callbacks."""
+import pytest
+
+pytest.importorskip("pynput")
+
+from macro_py.MacroRecorder import MacroRecorder, _is_significant_move  # noqa: E402
+
+
+def move(x, y, t):
+    return {"type": "mouse_move", "x": x, "y": y, "time": t}
+
+
+def click(t):
+    return {
+        "type": "mouse_click",
+        "x": 0,
+        "y": 0,
+        "button": "Button.left",
+        "pressed": True,
+        "time": t,
+    }
+
+
+@pytest.fixture
+def recorder():
+    rec = MacroRecorder()
+    rec.move_coalesce_s = 0.01
+    rec.notified = []
+    rec.event_callback = rec.notified.append
+    return rec
+
+
+def test_move_within_window_replaces_previous_move(recorder):
+    recorder._append_event(move(0, 0, 0.0))
+    recorder._append_event(move(5, 5, 0.004))
+
+    assert recorder.events == [move(5, 5, 0.004)]
+    # The replacing move is not reported as a new event
+    assert recorder.notified == [[move(0, 0, 0.0)]]
+
+
+def test_window_is_anchored_at_its_first_move(recorder):
+    for t in (0.0, 0.006, 0.012):
+        recorder._append_event(move(0, 0, t))
+
+    assert [e["time"] for e in recorder.events] == [0.006, 0.012]
+    assert len(recorder.notified) == len(recorder.events)
+
+
+def test_other_events_end_the_move_window(recorder):
+    recorder._append_event(move(0, 0, 0.0))
+    recorder._append_event(click(0.001))
+    recorder._append_event(move(1, 1, 0.002))
+
+    assert [e["type"] for e in recorder.events] == [
+        "mouse_move",
+        "mouse_click",
+        "mouse_move",
+    ]
+    assert len(recorder.notified) == 3
+
+
+def test_zero_window_keeps_every_move(recorder):
+    recorder.move_coalesce_s = 0
+    recorder._append_event(move(0, 0, 0.0))
+    recorder._append_event(move(1, 1, 0.0))
+
+    assert len(recorder.events) == 2
+
+
+def test_batch_reports_only_the_events_kept(recorder):
+    recorder._append_events([move(0, 0, 0.0), move(5, 5, 0.004), click(0.005)])
+
+    assert recorder.events == [move(5, 5, 0.004), click(0.005)]
+    assert recorder.notified == [[move(5, 5, 0.004), click(0.005)]]
+
+
+def test_batch_does_not_report_a_replaced_earlier_move(recorder):
+    recorder._append_event(move(0, 0, 0.0))
+    recorder._append_events([move(5, 5, 0.004)])
+
+    assert recorder.events == [move(5, 5, 0.004)]
+    assert recorder.notified == [[move(0, 0, 0.0)]]
+
+
+def test_significant_move_threshold():
+    assert _is_significant_move(0, 0, None)
+    assert not _is_significant_move(10, 10, (0, 0), min_delta=10)
+    assert _is_significant_move(11, 0, (0, 0), min_delta=10)
+    assert _is_significant_move(0, -11, (0, 0), min_delta=10)